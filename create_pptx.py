@@ -1,12 +1,39 @@
+"""
+Build the TreeHacks pitch decks.
+
+  python create_pptx.py                      — hand-laid EdgeRescue deck
+  python create_pptx.py --md presentation.md — incremental build from markdown
+  python create_pptx.py --bench-tables 300x10 — style_cell vs fill_table timing
+
+The markdown build hashes every slide's content together with the styling
+code, keeps the parsed markdown and each slide's XML in .deck_cache/, and
+only re-renders slides whose hash changed.
+"""
+
+import argparse
+import copy
+import hashlib
+import inspect
+import json
+import os
+import re
+import time
+
+from lxml import etree
 from pptx import Presentation
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
 from pptx.util import Inches, Pt, Emu
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
 
-prs = Presentation()
-prs.slide_width = Inches(13.333)
-prs.slide_height = Inches(7.5)
+SLIDE_WIDTH = Inches(13.333)
+SLIDE_HEIGHT = Inches(7.5)
+BLANK_LAYOUT = 6
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(HERE, ".deck_cache")
 
 # --- Color Palette ---
 BG_DARK = RGBColor(0x0F, 0x0F, 0x0F)
@@ -22,6 +49,13 @@ TABLE_ROW_BG = RGBColor(0x14, 0x14, 0x24)
 TABLE_ALT_BG = RGBColor(0x1A, 0x1A, 0x30)
 
 
+def new_presentation():
+    prs = Presentation()
+    prs.slide_width = SLIDE_WIDTH
+    prs.slide_height = SLIDE_HEIGHT
+    return prs
+
+
 def set_slide_bg(slide, color):
     bg = slide.background
     fill = bg.fill
@@ -78,6 +112,62 @@ def style_cell(cell, text, font_size=14, color=WHITE, bold=False, bg_color=None)
     cell.vertical_anchor = MSO_ANCHOR.MIDDLE
 
 
+def _cell_proto(font_size, color, bold, bg_color):
+    """A styled, empty <a:tc> identical to what style_cell leaves behind."""
+    fill = f'<a:solidFill><a:srgbClr val="{bg_color}"/></a:solidFill>' if bg_color else ""
+    return parse_xml(
+        f'<a:tc {nsdecls("a")}><a:txBody><a:bodyPr wrap="square"/><a:lstStyle/>'
+        f'<a:p><a:pPr><a:defRPr sz="{int(font_size * 100)}" b="{int(bool(bold))}">'
+        f'<a:solidFill><a:srgbClr val="{color}"/></a:solidFill><a:latin typeface="Calibri"/>'
+        f'</a:defRPr></a:pPr></a:p></a:txBody><a:tcPr anchor="ctr">{fill}</a:tcPr></a:tc>'
+    )
+
+
+def _set_cell_text(tc, text):
+    p = tc.find(qn("a:txBody")).find(qn("a:p"))
+    for n, line in enumerate(str(text).split("\n")):
+        if n:
+            p.append(p.makeelement(qn("a:br"), {}))
+        if line:
+            r = p.makeelement(qn("a:r"), {})
+            t = r.makeelement(qn("a:t"), {})
+            t.text = line
+            r.append(t)
+            p.append(r)
+
+
+def fill_table(tbl, data, font_size=12, header_size=None, header_color=NVIDIA_GREEN,
+               col_colors=None, bold_cols=(0,), header_bg=TABLE_HEADER_BG,
+               stripes=(TABLE_ROW_BG, TABLE_ALT_BG)):
+    """Bulk equivalent of calling style_cell on every cell of a table.
+
+    data[0] is the header row; body rows cycle through `stripes`. One styled
+    <a:tc> is built per (stripe, column) and deep-copied into each cell,
+    instead of going through the python-pptx setters cell by cell.
+    """
+    cols = len(tbl.columns)
+    col_colors = col_colors or [WHITE] * cols
+    header = _cell_proto(header_size or font_size + 1, header_color, True, header_bg)
+    header_row = [header] * cols
+    body_rows = [
+        [_cell_proto(font_size, col_colors[c], c in bold_cols, bg) for c in range(cols)]
+        for bg in stripes
+    ]
+    for r, (tr, row) in enumerate(zip(tbl._tbl.tr_lst, data)):
+        protos = header_row if r == 0 else body_rows[(r - 1) % len(body_rows)]
+        for c, tc in enumerate(tr.tc_lst):
+            new_tc = copy.deepcopy(protos[c])
+            _set_cell_text(new_tc, row[c] if c < len(row) else "")
+            tr.replace(tc, new_tc)
+    return tbl
+
+
+def add_data_table(slide, data, left, top, width, height, **style):
+    """add_table + fill_table for a whole 2-D array (first row is the header)."""
+    tbl = add_table(slide, len(data), max(len(row) for row in data), left, top, width, height)
+    return fill_table(tbl, data, **style)
+
+
 def add_accent_line(slide, left, top, width, color=NVIDIA_GREEN):
     shape = slide.shapes.add_shape(
         MSO_SHAPE.RECTANGLE, Inches(left), Inches(top), Inches(width), Pt(4)
@@ -100,454 +190,803 @@ def add_device_box(slide, left, top, width, height, title, subtitle, details, bo
     add_textbox(slide, left + 0.15, top + 0.85, width - 0.3, height - 1.0, details, font_size=11, color=LIGHT_GRAY, alignment=PP_ALIGN.CENTER)
 
 
-# ============================================================
-# SLIDE 1: Title
-# ============================================================
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-set_slide_bg(slide, BG_DARK)
-add_accent_line(slide, 3, 1.8, 7.333)
-add_textbox(slide, 1, 2.0, 11.333, 1.5, "Edge Rescue", font_size=54, color=WHITE, bold=True, alignment=PP_ALIGN.CENTER)
-add_textbox(slide, 1, 3.2, 11.333, 0.8, "Humans, Robots, and AI \u2014 Working Together", font_size=28, color=NVIDIA_GREEN, alignment=PP_ALIGN.CENTER)
-add_textbox(slide, 1, 4.1, 11.333, 0.7,
-    "Sim-validated autonomous robotics for disaster response.",
-    font_size=18, color=LIGHT_GRAY, alignment=PP_ALIGN.CENTER)
-add_textbox(slide, 1, 4.6, 11.333, 0.5,
-    "Plan. Simulate. Validate. Build. \u2014 No cloud, no internet, fully on edge hardware.",
-    font_size=16, color=LIGHT_GRAY, alignment=PP_ALIGN.CENTER)
-add_textbox(slide, 1, 5.5, 11.333, 0.5, "Eashan Iyer  |  Samuel Lihn  |  Gordon Jin  |  Trevor Kwan", font_size=18, color=LIGHT_GRAY, alignment=PP_ALIGN.CENTER)
-add_textbox(slide, 1, 6.1, 11.333, 0.5, "TreeHacks 2026", font_size=16, color=LIGHT_GRAY, alignment=PP_ALIGN.CENTER)
-
-# ============================================================
-# SLIDE 2: The Story (condensed)
-# ============================================================
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-set_slide_bg(slide, BG_DARK)
-add_textbox(slide, 0.8, 0.4, 11.7, 0.8, "HATAY, TURKEY  \u2014  FEBRUARY 6, 2023", font_size=14, color=ACCENT_RED, bold=True)
-add_accent_line(slide, 0.8, 0.8, 2, color=ACCENT_RED)
-
-# Left: the disaster facts
-tf = add_textbox(slide, 0.8, 1.2, 6.0, 5.5, "", font_size=18)
-add_paragraph(tf, "4:17 AM. A 7.8-magnitude earthquake hits.", font_size=24, color=WHITE, bold=True)
-add_paragraph(tf, "", font_size=6)
-add_paragraph(tf, "59,000 dead across Turkey and Syria.", font_size=20, color=ACCENT_RED, bold=True, space_before=8)
-add_paragraph(tf, "230,000+ buildings damaged or destroyed.", font_size=18, color=WHITE, space_before=8)
-add_paragraph(tf, "", font_size=6)
-add_paragraph(tf, "The flaw wasn't bravery. It was information.", font_size=20, color=WHITE, bold=True, space_before=16)
-add_paragraph(tf, "", font_size=6)
-add_paragraph(tf, "Rescue teams couldn't reach remote villages for 3\u20134 days.", font_size=16, color=LIGHT_GRAY, space_before=6)
-add_paragraph(tf, "Syria's White Helmets had no heavy equipment \u2014 it never came.", font_size=16, color=LIGHT_GRAY, space_before=6)
-add_paragraph(tf, "At collapsed buildings, teams faced an impossible question:", font_size=16, color=LIGHT_GRAY, space_before=6)
-add_paragraph(tf, "\"If we move this slab, will the rest collapse on us?\"", font_size=18, color=WHITE, bold=True, space_before=6)
-add_paragraph(tf, "No simulation. No structural model. Just gut instinct", font_size=16, color=LIGHT_GRAY, space_before=4)
-add_paragraph(tf, "under extreme time pressure.", font_size=16, color=LIGHT_GRAY, space_before=0)
-
-# Right: the survival clock
-shape = slide.shapes.add_shape(
-    MSO_SHAPE.ROUNDED_RECTANGLE, Inches(7.5), Inches(1.2), Inches(5.0), Inches(4.8)
-)
-shape.fill.solid()
-shape.fill.fore_color.rgb = RGBColor(0x1A, 0x0A, 0x0A)
-shape.line.color.rgb = ACCENT_RED
-shape.line.width = Pt(2)
-
-add_textbox(slide, 7.7, 1.4, 4.6, 0.5, "THE SURVIVAL CLOCK", font_size=16, color=ACCENT_RED, bold=True, alignment=PP_ALIGN.CENTER)
-
-clock_data = [
-    ("< 24 hours", "90%", "survival rate"),
-    ("24\u201348 hours", "50\u201360%", "survival rate"),
-    ("48\u201372 hours", "20\u201330%", "survival rate"),
-    ("> 72 hours", "5\u201310%", "survival rate"),
-]
-cy = 2.1
-for time, rate, label in clock_data:
-    add_textbox(slide, 7.9, cy, 2.0, 0.45, time, font_size=15, color=LIGHT_GRAY, bold=True)
-    add_textbox(slide, 9.9, cy, 1.5, 0.45, rate, font_size=22, color=WHITE, bold=True, alignment=PP_ALIGN.RIGHT)
-    add_textbox(slide, 11.5, cy + 0.05, 0.8, 0.4, label, font_size=11, color=LIGHT_GRAY)
-    cy += 0.55
-
-add_textbox(slide, 7.7, 4.4, 4.6, 0.9,
-    "Every hour a robot waits for a structural assessment is an hour a survivor may not have.",
-    font_size=14, color=LIGHT_GRAY, alignment=PP_ALIGN.CENTER)
-
-# Bottom transition
-tf = add_textbox(slide, 0.8, 6.3, 11.7, 0.9,
-    "What if the robot didn't have to guess? What if it could simulate the physics of a collapse,",
-    font_size=20, color=WHITE, bold=True, alignment=PP_ALIGN.CENTER)
-add_paragraph(tf, "test 100 approaches in seconds, and only commit to the safest one \u2014 with no internet?",
-    font_size=20, color=NVIDIA_GREEN, bold=True, alignment=PP_ALIGN.CENTER, space_before=2)
-
-# ============================================================
-# SLIDE 3: Our Solution
-# ============================================================
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-set_slide_bg(slide, BG_DARK)
-add_textbox(slide, 0.8, 0.4, 11.7, 0.8, "EDGE RESCUE", font_size=14, color=NVIDIA_GREEN, bold=True)
-add_accent_line(slide, 0.8, 0.8, 2)
-tf = add_textbox(slide, 0.8, 1.0, 11.7, 0.8,
-    "Plan. Simulate. Validate. Build.",
-    font_size=36, color=WHITE, bold=True)
-
-steps = [
-    ("1", "PROMPT", "\"Build a reinforced shelter\" \u2014 natural language, spoken or typed", ACCENT_BLUE),
-    ("2", "PLAN", "Local LLM on DGX Spark decomposes into subtasks \u2014 no cloud, no internet", ACCENT_BLUE),
-    ("3", "SIMULATE", "Isaac Sim tests each action: will it fall? Will it survive lateral forces?", NVIDIA_GREEN),
-    ("4", "VALIDATE", "Only physics-validated actions are sent to the real robot", NVIDIA_GREEN),
-    ("5", "BUILD", "SO-101 arm executes the safe plan", WHITE),
-    ("6", "ADAPT", "If reality doesn't match the sim (block slips, misalignment), re-plan automatically", ACCENT_RED),
-]
+def build_edge_rescue(prs):
+    """Hand-laid EdgeRescue deck (every slide rebuilt on each run)."""
+    # ============================================================
+    # SLIDE 1: Title
+    # ============================================================
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    set_slide_bg(slide, BG_DARK)
+    add_accent_line(slide, 3, 1.8, 7.333)
+    add_textbox(slide, 1, 2.0, 11.333, 1.5, "Edge Rescue", font_size=54, color=WHITE, bold=True, alignment=PP_ALIGN.CENTER)
+    add_textbox(slide, 1, 3.2, 11.333, 0.8, "Humans, Robots, and AI \u2014 Working Together", font_size=28, color=NVIDIA_GREEN, alignment=PP_ALIGN.CENTER)
+    add_textbox(slide, 1, 4.1, 11.333, 0.7,
+        "Sim-validated autonomous robotics for disaster response.",
+        font_size=18, color=LIGHT_GRAY, alignment=PP_ALIGN.CENTER)
+    add_textbox(slide, 1, 4.6, 11.333, 0.5,
+        "Plan. Simulate. Validate. Build. \u2014 No cloud, no internet, fully on edge hardware.",
+        font_size=16, color=LIGHT_GRAY, alignment=PP_ALIGN.CENTER)
+    add_textbox(slide, 1, 5.5, 11.333, 0.5, "Eashan Iyer  |  Samuel Lihn  |  Gordon Jin  |  Trevor Kwan", font_size=18, color=LIGHT_GRAY, alignment=PP_ALIGN.CENTER)
+    add_textbox(slide, 1, 6.1, 11.333, 0.5, "TreeHacks 2026", font_size=16, color=LIGHT_GRAY, alignment=PP_ALIGN.CENTER)
+
+    # ============================================================
+    # SLIDE 2: The Story (condensed)
+    # ============================================================
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    set_slide_bg(slide, BG_DARK)
+    add_textbox(slide, 0.8, 0.4, 11.7, 0.8, "HATAY, TURKEY  \u2014  FEBRUARY 6, 2023", font_size=14, color=ACCENT_RED, bold=True)
+    add_accent_line(slide, 0.8, 0.8, 2, color=ACCENT_RED)
+
+    # Left: the disaster facts
+    tf = add_textbox(slide, 0.8, 1.2, 6.0, 5.5, "", font_size=18)
+    add_paragraph(tf, "4:17 AM. A 7.8-magnitude earthquake hits.", font_size=24, color=WHITE, bold=True)
+    add_paragraph(tf, "", font_size=6)
+    add_paragraph(tf, "59,000 dead across Turkey and Syria.", font_size=20, color=ACCENT_RED, bold=True, space_before=8)
+    add_paragraph(tf, "230,000+ buildings damaged or destroyed.", font_size=18, color=WHITE, space_before=8)
+    add_paragraph(tf, "", font_size=6)
+    add_paragraph(tf, "The flaw wasn't bravery. It was information.", font_size=20, color=WHITE, bold=True, space_before=16)
+    add_paragraph(tf, "", font_size=6)
+    add_paragraph(tf, "Rescue teams couldn't reach remote villages for 3\u20134 days.", font_size=16, color=LIGHT_GRAY, space_before=6)
+    add_paragraph(tf, "Syria's White Helmets had no heavy equipment \u2014 it never came.", font_size=16, color=LIGHT_GRAY, space_before=6)
+    add_paragraph(tf, "At collapsed buildings, teams faced an impossible question:", font_size=16, color=LIGHT_GRAY, space_before=6)
+    add_paragraph(tf, "\"If we move this slab, will the rest collapse on us?\"", font_size=18, color=WHITE, bold=True, space_before=6)
+    add_paragraph(tf, "No simulation. No structural model. Just gut instinct", font_size=16, color=LIGHT_GRAY, space_before=4)
+    add_paragraph(tf, "under extreme time pressure.", font_size=16, color=LIGHT_GRAY, space_before=0)
+
+    # Right: the survival clock
+    shape = slide.shapes.add_shape(
+        MSO_SHAPE.ROUNDED_RECTANGLE, Inches(7.5), Inches(1.2), Inches(5.0), Inches(4.8)
+    )
+    shape.fill.solid()
+    shape.fill.fore_color.rgb = RGBColor(0x1A, 0x0A, 0x0A)
+    shape.line.color.rgb = ACCENT_RED
+    shape.line.width = Pt(2)
 
-y = 2.2
-for num, title, desc, color in steps:
+    add_textbox(slide, 7.7, 1.4, 4.6, 0.5, "THE SURVIVAL CLOCK", font_size=16, color=ACCENT_RED, bold=True, alignment=PP_ALIGN.CENTER)
+
+    clock_data = [
+        ("< 24 hours", "90%", "survival rate"),
+        ("24\u201348 hours", "50\u201360%", "survival rate"),
+        ("48\u201372 hours", "20\u201330%", "survival rate"),
+        ("> 72 hours", "5\u201310%", "survival rate"),
+    ]
+    cy = 2.1
+    for when, rate, label in clock_data:
+        add_textbox(slide, 7.9, cy, 2.0, 0.45, when, font_size=15, color=LIGHT_GRAY, bold=True)
+        add_textbox(slide, 9.9, cy, 1.5, 0.45, rate, font_size=22, color=WHITE, bold=True, alignment=PP_ALIGN.RIGHT)
+        add_textbox(slide, 11.5, cy + 0.05, 0.8, 0.4, label, font_size=11, color=LIGHT_GRAY)
+        cy += 0.55
+
+    add_textbox(slide, 7.7, 4.4, 4.6, 0.9,
+        "Every hour a robot waits for a structural assessment is an hour a survivor may not have.",
+        font_size=14, color=LIGHT_GRAY, alignment=PP_ALIGN.CENTER)
+
+    # Bottom transition
+    tf = add_textbox(slide, 0.8, 6.3, 11.7, 0.9,
+        "What if the robot didn't have to guess? What if it could simulate the physics of a collapse,",
+        font_size=20, color=WHITE, bold=True, alignment=PP_ALIGN.CENTER)
+    add_paragraph(tf, "test 100 approaches in seconds, and only commit to the safest one \u2014 with no internet?",
+        font_size=20, color=NVIDIA_GREEN, bold=True, alignment=PP_ALIGN.CENTER, space_before=2)
+
+    # ============================================================
+    # SLIDE 3: Our Solution
+    # ============================================================
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    set_slide_bg(slide, BG_DARK)
+    add_textbox(slide, 0.8, 0.4, 11.7, 0.8, "EDGE RESCUE", font_size=14, color=NVIDIA_GREEN, bold=True)
+    add_accent_line(slide, 0.8, 0.8, 2)
+    tf = add_textbox(slide, 0.8, 1.0, 11.7, 0.8,
+        "Plan. Simulate. Validate. Build.",
+        font_size=36, color=WHITE, bold=True)
+
+    steps = [
+        ("1", "PROMPT", "\"Build a reinforced shelter\" \u2014 natural language, spoken or typed", ACCENT_BLUE),
+        ("2", "PLAN", "Local LLM on DGX Spark decomposes into subtasks \u2014 no cloud, no internet", ACCENT_BLUE),
+        ("3", "SIMULATE", "Isaac Sim tests each action: will it fall? Will it survive lateral forces?", NVIDIA_GREEN),
+        ("4", "VALIDATE", "Only physics-validated actions are sent to the real robot", NVIDIA_GREEN),
+        ("5", "BUILD", "SO-101 arm executes the safe plan", WHITE),
+        ("6", "ADAPT", "If reality doesn't match the sim (block slips, misalignment), re-plan automatically", ACCENT_RED),
+    ]
+
+    y = 2.2
+    for num, title, desc, color in steps:
+        shape = slide.shapes.add_shape(
+            MSO_SHAPE.OVAL, Inches(1.0), Inches(y), Inches(0.55), Inches(0.55)
+        )
+        shape.fill.solid()
+        shape.fill.fore_color.rgb = color
+        shape.line.fill.background()
+        tf_shape = shape.text_frame
+        tf_shape.paragraphs[0].text = num
+        tf_shape.paragraphs[0].font.size = Pt(18)
+        tf_shape.paragraphs[0].font.color.rgb = BG_DARK
+        tf_shape.paragraphs[0].font.bold = True
+        tf_shape.paragraphs[0].alignment = PP_ALIGN.CENTER
+
+        add_textbox(slide, 1.8, y - 0.05, 2.0, 0.55, title, font_size=18, color=color, bold=True)
+        add_textbox(slide, 3.8, y, 8.7, 0.55, desc, font_size=16, color=LIGHT_GRAY)
+        y += 0.75
+
+    add_textbox(slide, 0.8, 6.8, 11.7, 0.5,
+        "The AI breaks it in simulation so it doesn't break in reality.",
+        font_size=22, color=NVIDIA_GREEN, bold=True, alignment=PP_ALIGN.CENTER)
+
+    # ============================================================
+    # SLIDE 4: You May Have Seen... (Differentiation)
+    # ============================================================
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    set_slide_bg(slide, BG_DARK)
+    add_textbox(slide, 0.8, 0.4, 11.7, 0.8, "YOU MAY HAVE SEEN...", font_size=14, color=NVIDIA_GREEN, bold=True)
+    add_accent_line(slide, 0.8, 0.8, 2)
+
+    # Left column header
+    add_textbox(slide, 0.8, 1.1, 5.8, 0.5, "What Exists", font_size=22, color=LIGHT_GRAY, bold=True)
+
+    # DeepMind
+    tf = add_textbox(slide, 0.8, 1.8, 5.8, 1.2, "", font_size=16)
+    add_paragraph(tf, "Google DeepMind \u2014 Gemini Robotics 1.5", font_size=16, color=WHITE, bold=True)
+    add_paragraph(tf, "100B+ parameter VLA that \"thinks before it acts.\"", font_size=14, color=LIGHT_GRAY, space_before=4)
+    add_paragraph(tf, "Requires cloud, massive compute, and internet.", font_size=14, color=ACCENT_RED, space_before=2)
+    add_paragraph(tf, "Unusable in a disaster zone.", font_size=14, color=ACCENT_RED, bold=True, space_before=2)
+
+    # Digital Twins
+    tf = add_textbox(slide, 0.8, 3.5, 5.8, 1.0, "", font_size=16)
+    add_paragraph(tf, "Industry Digital Twins (Siemens, BMW, NVIDIA Omniverse)", font_size=16, color=WHITE, bold=True)
+    add_paragraph(tf, "Mirror a factory floor for monitoring. Passive \u2014", font_size=14, color=LIGHT_GRAY, space_before=4)
+    add_paragraph(tf, "they watch, they don't plan or validate.", font_size=14, color=ACCENT_RED, space_before=2)
+
+    # Text-to-Robot
+    tf = add_textbox(slide, 0.8, 4.9, 5.8, 1.0, "", font_size=16)
+    add_paragraph(tf, "Text-to-Robot (VoxPoser, RoboGPT)", font_size=16, color=WHITE, bold=True)
+    add_paragraph(tf, "Prompt \u2192 one-shot execution. No physics validation.", font_size=14, color=LIGHT_GRAY, space_before=4)
+    add_paragraph(tf, "If the LLM hallucinates an unstable structure, the robot builds it anyway.", font_size=14, color=ACCENT_RED, space_before=2)
+
+    # Divider line
     shape = slide.shapes.add_shape(
-        MSO_SHAPE.OVAL, Inches(1.0), Inches(y), Inches(0.55), Inches(0.55)
+        MSO_SHAPE.RECTANGLE, Inches(6.9), Inches(1.1), Pt(2), Inches(5.2)
     )
     shape.fill.solid()
-    shape.fill.fore_color.rgb = color
+    shape.fill.fore_color.rgb = RGBColor(0x44, 0x44, 0x44)
     shape.line.fill.background()
-    tf_shape = shape.text_frame
-    tf_shape.paragraphs[0].text = num
-    tf_shape.paragraphs[0].font.size = Pt(18)
-    tf_shape.paragraphs[0].font.color.rgb = BG_DARK
-    tf_shape.paragraphs[0].font.bold = True
-    tf_shape.paragraphs[0].alignment = PP_ALIGN.CENTER
-
-    add_textbox(slide, 1.8, y - 0.05, 2.0, 0.55, title, font_size=18, color=color, bold=True)
-    add_textbox(slide, 3.8, y, 8.7, 0.55, desc, font_size=16, color=LIGHT_GRAY)
-    y += 0.75
-
-add_textbox(slide, 0.8, 6.8, 11.7, 0.5,
-    "The AI breaks it in simulation so it doesn't break in reality.",
-    font_size=22, color=NVIDIA_GREEN, bold=True, alignment=PP_ALIGN.CENTER)
 
-# ============================================================
-# SLIDE 4: You May Have Seen... (Differentiation)
-# ============================================================
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-set_slide_bg(slide, BG_DARK)
-add_textbox(slide, 0.8, 0.4, 11.7, 0.8, "YOU MAY HAVE SEEN...", font_size=14, color=NVIDIA_GREEN, bold=True)
-add_accent_line(slide, 0.8, 0.8, 2)
-
-# Left column header
-add_textbox(slide, 0.8, 1.1, 5.8, 0.5, "What Exists", font_size=22, color=LIGHT_GRAY, bold=True)
-
-# DeepMind
-tf = add_textbox(slide, 0.8, 1.8, 5.8, 1.2, "", font_size=16)
-add_paragraph(tf, "Google DeepMind \u2014 Gemini Robotics 1.5", font_size=16, color=WHITE, bold=True)
-add_paragraph(tf, "100B+ parameter VLA that \"thinks before it acts.\"", font_size=14, color=LIGHT_GRAY, space_before=4)
-add_paragraph(tf, "Requires cloud, massive compute, and internet.", font_size=14, color=ACCENT_RED, space_before=2)
-add_paragraph(tf, "Unusable in a disaster zone.", font_size=14, color=ACCENT_RED, bold=True, space_before=2)
-
-# Digital Twins
-tf = add_textbox(slide, 0.8, 3.5, 5.8, 1.0, "", font_size=16)
-add_paragraph(tf, "Industry Digital Twins (Siemens, BMW, NVIDIA Omniverse)", font_size=16, color=WHITE, bold=True)
-add_paragraph(tf, "Mirror a factory floor for monitoring. Passive \u2014", font_size=14, color=LIGHT_GRAY, space_before=4)
-add_paragraph(tf, "they watch, they don't plan or validate.", font_size=14, color=ACCENT_RED, space_before=2)
-
-# Text-to-Robot
-tf = add_textbox(slide, 0.8, 4.9, 5.8, 1.0, "", font_size=16)
-add_paragraph(tf, "Text-to-Robot (VoxPoser, RoboGPT)", font_size=16, color=WHITE, bold=True)
-add_paragraph(tf, "Prompt \u2192 one-shot execution. No physics validation.", font_size=14, color=LIGHT_GRAY, space_before=4)
-add_paragraph(tf, "If the LLM hallucinates an unstable structure, the robot builds it anyway.", font_size=14, color=ACCENT_RED, space_before=2)
-
-# Divider line
-shape = slide.shapes.add_shape(
-    MSO_SHAPE.RECTANGLE, Inches(6.9), Inches(1.1), Pt(2), Inches(5.2)
-)
-shape.fill.solid()
-shape.fill.fore_color.rgb = RGBColor(0x44, 0x44, 0x44)
-shape.line.fill.background()
-
-# Right column header
-add_textbox(slide, 7.2, 1.1, 5.8, 0.5, "What We Built", font_size=22, color=NVIDIA_GREEN, bold=True)
-
-right_items = [
-    ("Runs entirely on local edge hardware", "DGX Spark + Jetson + Isaac Sim. No internet required."),
-    ("The sim doesn't just mirror \u2014 it plans ahead", "Proposes the next construction phase and stress-tests it before the robot commits."),
-    ("Every action is physics-validated", "The LLM proposes, the sim disposes. Nothing executes without passing physics checks."),
-    ("Bidirectional feedback loop", "When reality doesn't match sim (block slips), the system re-plans autonomously."),
-]
-
-ry = 1.8
-for title, desc in right_items:
-    add_textbox(slide, 7.4, ry, 5.4, 0.35, title, font_size=16, color=NVIDIA_GREEN, bold=True)
-    add_textbox(slide, 7.4, ry + 0.35, 5.4, 0.45, desc, font_size=14, color=LIGHT_GRAY)
-    ry += 1.1
-
-# Bottom punchline
-shape = slide.shapes.add_shape(
-    MSO_SHAPE.ROUNDED_RECTANGLE, Inches(1.5), Inches(6.5), Inches(10.3), Inches(0.75)
-)
-shape.fill.solid()
-shape.fill.fore_color.rgb = RGBColor(0x1A, 0x1A, 0x2E)
-shape.line.color.rgb = NVIDIA_GREEN
-shape.line.width = Pt(2)
-
-add_textbox(slide, 1.7, 6.55, 9.9, 0.65,
-    "DeepMind showed that robots should think before they act. We showed you can do it on edge hardware with no internet.",
-    font_size=17, color=WHITE, bold=True, alignment=PP_ALIGN.CENTER)
-
-# ============================================================
-# SLIDE 5: The Demo
-# ============================================================
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-set_slide_bg(slide, BG_DARK)
-add_textbox(slide, 0.8, 0.4, 11.7, 0.8, "THE DEMO \u2014 EARTHQUAKE TEST", font_size=14, color=NVIDIA_GREEN, bold=True)
-add_accent_line(slide, 0.8, 0.8, 2)
-
-demo_steps = [
-    ("\u2776  PROMPT", "\"Build a tower\" \u2014 DGX Spark LLM breaks this into pick-and-place subtasks", ACCENT_BLUE),
-    ("\u2777  BUILD", "Physical arm stacks blocks. Isaac Sim mirrors every move in real time (split screen).", WHITE),
-    ("\u2778  STRESS TEST", "Isaac Sim applies lateral forces (earthquake simulation). Tower collapses in sim. Real tower is untouched.", ACCENT_RED),
-    ("\u2779  REDESIGN", "LLM analyzes the simulated collapse. Redesigns with wider base and interlocking pattern.", NVIDIA_GREEN),
-    ("\u277A  REBUILD", "Arm rebuilds the reinforced version. Isaac Sim confirms it survives the same earthquake.", NVIDIA_GREEN),
-]
+    # Right column header
+    add_textbox(slide, 7.2, 1.1, 5.8, 0.5, "What We Built", font_size=22, color=NVIDIA_GREEN, bold=True)
 
-y = 1.2
-for title, desc, color in demo_steps:
-    add_textbox(slide, 0.8, y, 3.5, 0.8, title, font_size=22, color=color, bold=True)
-    add_textbox(slide, 4.3, y + 0.05, 8.2, 0.8, desc, font_size=16, color=LIGHT_GRAY)
-    y += 1.05
+    right_items = [
+        ("Runs entirely on local edge hardware", "DGX Spark + Jetson + Isaac Sim. No internet required."),
+        ("The sim doesn't just mirror \u2014 it plans ahead", "Proposes the next construction phase and stress-tests it before the robot commits."),
+        ("Every action is physics-validated", "The LLM proposes, the sim disposes. Nothing executes without passing physics checks."),
+        ("Bidirectional feedback loop", "When reality doesn't match sim (block slips), the system re-plans autonomously."),
+    ]
 
-tf = add_textbox(slide, 0.8, 6.6, 11.7, 0.7,
-    "The same loop that reinforces a block tower is what would prevent a rescue robot from pulling the wrong beam.",
-    font_size=22, color=WHITE, bold=True, alignment=PP_ALIGN.CENTER)
+    ry = 1.8
+    for title, desc in right_items:
+        add_textbox(slide, 7.4, ry, 5.4, 0.35, title, font_size=16, color=NVIDIA_GREEN, bold=True)
+        add_textbox(slide, 7.4, ry + 0.35, 5.4, 0.45, desc, font_size=14, color=LIGHT_GRAY)
+        ry += 1.1
 
-# ============================================================
-# SLIDE 6: Architecture
-# ============================================================
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-set_slide_bg(slide, BG_DARK)
-add_textbox(slide, 0.8, 0.4, 11.7, 0.8, "ARCHITECTURE", font_size=14, color=NVIDIA_GREEN, bold=True)
-add_accent_line(slide, 0.8, 0.8, 2)
-add_textbox(slide, 0.8, 1.0, 11.7, 0.7,
-    "Three devices. Four agents. Zero cloud dependency.",
-    font_size=30, color=WHITE, bold=True)
-
-# Top: Voice/Text prompt
-add_textbox(slide, 4.5, 1.7, 4.3, 0.45, "\u25BC  Voice / Text Prompt  \u25BC", font_size=14, color=LIGHT_GRAY, alignment=PP_ALIGN.CENTER)
-
-# DGX Spark
-add_device_box(slide, 4.2, 2.2, 4.9, 1.5,
-    "DGX SPARK", "Agent C: The Overlord",
-    "Local LLM \u2022 Task decomposition \u2022 Orchestration", NVIDIA_GREEN)
-
-# Arrow down left
-add_textbox(slide, 3.0, 3.75, 2.5, 0.4, "subtasks \u25BC", font_size=12, color=LIGHT_GRAY, alignment=PP_ALIGN.CENTER)
-# Arrow down right
-add_textbox(slide, 7.8, 3.75, 2.5, 0.4, "validation requests \u25BC", font_size=12, color=LIGHT_GRAY, alignment=PP_ALIGN.CENTER)
-
-# Jetson (bottom left)
-add_device_box(slide, 0.8, 4.2, 5.0, 1.8,
-    "JETSON ORIN NANO", "Agent A: The Builder",
-    "VLM perception \u2022 Motor control \u2022 Camera feed\n\u2192 Drives SO-101 Follower Arm", ACCENT_BLUE)
-
-# Isaac Sim (bottom right)
-add_device_box(slide, 7.5, 4.2, 5.0, 1.8,
-    "RTX 3070 \u2014 ISAAC SIM", "Agent B: The Architect",
-    "Physics simulation \u2022 Stress testing \u2022 Validation\n\u2192 Digital Twin of workspace", NVIDIA_GREEN)
-
-# Feedback arrow
-add_textbox(slide, 4.0, 6.1, 5.3, 0.4, "\u25C0\u2500\u2500 feedback loop \u2500\u2500\u25B6", font_size=14, color=ACCENT_RED, alignment=PP_ALIGN.CENTER)
-
-# Agent D note
-add_textbox(slide, 0.8, 6.6, 11.7, 0.6,
-    "Agent D: The Operator \u2014 Human override via Leader Arm for safety-critical fallback",
-    font_size=14, color=LIGHT_GRAY, alignment=PP_ALIGN.CENTER)
-
-# ============================================================
-# SLIDE 7: Why Edge + Hardware
-# (Merged old "Why Edge Matters" and "Hardware" slides)
-# ============================================================
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-set_slide_bg(slide, BG_DARK)
-add_textbox(slide, 0.8, 0.4, 11.7, 0.8, "WHY EDGE MATTERS", font_size=14, color=NVIDIA_GREEN, bold=True)
-add_accent_line(slide, 0.8, 0.8, 2)
-tf = add_textbox(slide, 0.8, 1.0, 11.7, 0.6,
-    "Hardware-native. Designed for environments where cloud doesn't exist.",
-    font_size=26, color=WHITE, bold=True)
-
-# Comparison table (compact)
-tbl = add_table(slide, 6, 3, 0.8, 1.8, 6.0, 3.5)
-headers = ["", "Cloud", "Edge Rescue"]
-for i, h in enumerate(headers):
-    style_cell(tbl.cell(0, i), h, font_size=13, bold=True, color=NVIDIA_GREEN, bg_color=TABLE_HEADER_BG)
-
-rows = [
-    ["Internet", "Required", "Not needed"],
-    ["Latency", "100\u2013500ms", "<10ms"],
-    ["Disaster zone", "Unusable", "Designed for it"],
-    ["Physics validation", "None", "Every action"],
-    ["Single point of failure", "Cloud outage", "Self-contained"],
-]
-for r, row in enumerate(rows):
-    bg = TABLE_ROW_BG if r % 2 == 0 else TABLE_ALT_BG
-    style_cell(tbl.cell(r+1, 0), row[0], font_size=12, color=WHITE, bold=True, bg_color=bg)
-    style_cell(tbl.cell(r+1, 1), row[1], font_size=12, color=ACCENT_RED, bg_color=bg)
-    style_cell(tbl.cell(r+1, 2), row[2], font_size=12, color=NVIDIA_GREEN, bold=True, bg_color=bg)
-
-tbl.columns[0].width = Inches(2.0)
-tbl.columns[1].width = Inches(2.0)
-tbl.columns[2].width = Inches(2.0)
-
-# Hardware list (right side)
-add_textbox(slide, 7.3, 1.8, 5.5, 0.4, "HARDWARE ON THE TABLE", font_size=14, color=NVIDIA_GREEN, bold=True)
-
-hw_items = [
-    ("NVIDIA DGX Spark", "Local LLM \u2014 planning + orchestration"),
-    ("NVIDIA Jetson Orin Nano Super", "VLM perception + motor control"),
-    ("RTX 3070 Laptop", "Isaac Sim \u2014 physics validation"),
-    ("SO-101 Follower Arm", "Executes validated plans"),
-    ("SO-101 Leader Arm", "Human override for edge cases"),
-    ("2x Mono Cameras", "Stereo perception \u2192 digital twin"),
-]
-
-hy = 2.3
-for device, role in hw_items:
-    add_textbox(slide, 7.3, hy, 5.5, 0.3, device, font_size=14, color=WHITE, bold=True)
-    add_textbox(slide, 7.3, hy + 0.3, 5.5, 0.3, role, font_size=12, color=LIGHT_GRAY)
-    hy += 0.7
-
-# ============================================================
-# SLIDE 8: The Market
-# ============================================================
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-set_slide_bg(slide, BG_DARK)
-add_textbox(slide, 0.8, 0.4, 11.7, 0.8, "THE MARKET", font_size=14, color=NVIDIA_GREEN, bold=True)
-add_accent_line(slide, 0.8, 0.8, 2)
-add_textbox(slide, 0.8, 1.0, 11.7, 0.7,
-    "At the intersection of three rapidly growing markets.",
-    font_size=28, color=WHITE, bold=True)
-
-col_data = [
-    ("Disaster Response\nRobotics", "$2.5B \u2192 $6.2B", "by 2033 (10.5% CAGR)", "Search & rescue robots:\n$35.3B in 2025\n$70.3B by 2030", ACCENT_RED),
-    ("Digital Twin\nTechnology", "$35.8B \u2192 $328.5B", "by 2034 (31.1% CAGR)", "NVIDIA Omniverse deployed\nby TSMC, BMW, Siemens\nfor factory digital twins", ACCENT_BLUE),
-    ("Edge AI\nfor Robotics", "$1.2 Trillion", "in 2025 US manufacturing\ninvestment", "NVIDIA Jetson, Isaac Sim,\nDGX Spark all built for\nexactly this use case", NVIDIA_GREEN),
-]
-
-x = 0.8
-for title, big_num, subtitle, details, color in col_data:
+    # Bottom punchline
     shape = slide.shapes.add_shape(
-        MSO_SHAPE.ROUNDED_RECTANGLE, Inches(x), Inches(2.0), Inches(3.7), Inches(4.8)
+        MSO_SHAPE.ROUNDED_RECTANGLE, Inches(1.5), Inches(6.5), Inches(10.3), Inches(0.75)
     )
     shape.fill.solid()
     shape.fill.fore_color.rgb = RGBColor(0x1A, 0x1A, 0x2E)
-    shape.line.color.rgb = color
+    shape.line.color.rgb = NVIDIA_GREEN
     shape.line.width = Pt(2)
 
-    add_textbox(slide, x + 0.2, 2.15, 3.3, 0.8, title, font_size=18, color=color, bold=True, alignment=PP_ALIGN.CENTER)
-    add_textbox(slide, x + 0.2, 3.1, 3.3, 0.6, big_num, font_size=28, color=WHITE, bold=True, alignment=PP_ALIGN.CENTER)
-    add_textbox(slide, x + 0.2, 3.8, 3.3, 0.6, subtitle, font_size=13, color=LIGHT_GRAY, alignment=PP_ALIGN.CENTER)
-    add_textbox(slide, x + 0.2, 4.6, 3.3, 1.5, details, font_size=13, color=LIGHT_GRAY, alignment=PP_ALIGN.CENTER)
-    x += 4.1
-
-add_textbox(slide, 0.8, 6.9, 11.7, 0.4,
-    "Sources: Verified Market Reports, Mordor Intelligence, GM Insights, NVIDIA Newsroom",
-    font_size=11, color=RGBColor(0x66, 0x66, 0x66), alignment=PP_ALIGN.CENTER)
+    add_textbox(slide, 1.7, 6.55, 9.9, 0.65,
+        "DeepMind showed that robots should think before they act. We showed you can do it on edge hardware with no internet.",
+        font_size=17, color=WHITE, bold=True, alignment=PP_ALIGN.CENTER)
+
+    # ============================================================
+    # SLIDE 5: The Demo
+    # ============================================================
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    set_slide_bg(slide, BG_DARK)
+    add_textbox(slide, 0.8, 0.4, 11.7, 0.8, "THE DEMO \u2014 EARTHQUAKE TEST", font_size=14, color=NVIDIA_GREEN, bold=True)
+    add_accent_line(slide, 0.8, 0.8, 2)
+
+    demo_steps = [
+        ("\u2776  PROMPT", "\"Build a tower\" \u2014 DGX Spark LLM breaks this into pick-and-place subtasks", ACCENT_BLUE),
+        ("\u2777  BUILD", "Physical arm stacks blocks. Isaac Sim mirrors every move in real time (split screen).", WHITE),
+        ("\u2778  STRESS TEST", "Isaac Sim applies lateral forces (earthquake simulation). Tower collapses in sim. Real tower is untouched.", ACCENT_RED),
+        ("\u2779  REDESIGN", "LLM analyzes the simulated collapse. Redesigns with wider base and interlocking pattern.", NVIDIA_GREEN),
+        ("\u277A  REBUILD", "Arm rebuilds the reinforced version. Isaac Sim confirms it survives the same earthquake.", NVIDIA_GREEN),
+    ]
+
+    y = 1.2
+    for title, desc, color in demo_steps:
+        add_textbox(slide, 0.8, y, 3.5, 0.8, title, font_size=22, color=color, bold=True)
+        add_textbox(slide, 4.3, y + 0.05, 8.2, 0.8, desc, font_size=16, color=LIGHT_GRAY)
+        y += 1.05
+
+    tf = add_textbox(slide, 0.8, 6.6, 11.7, 0.7,
+        "The same loop that reinforces a block tower is what would prevent a rescue robot from pulling the wrong beam.",
+        font_size=22, color=WHITE, bold=True, alignment=PP_ALIGN.CENTER)
+
+    # ============================================================
+    # SLIDE 6: Architecture
+    # ============================================================
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    set_slide_bg(slide, BG_DARK)
+    add_textbox(slide, 0.8, 0.4, 11.7, 0.8, "ARCHITECTURE", font_size=14, color=NVIDIA_GREEN, bold=True)
+    add_accent_line(slide, 0.8, 0.8, 2)
+    add_textbox(slide, 0.8, 1.0, 11.7, 0.7,
+        "Three devices. Four agents. Zero cloud dependency.",
+        font_size=30, color=WHITE, bold=True)
+
+    # Top: Voice/Text prompt
+    add_textbox(slide, 4.5, 1.7, 4.3, 0.45, "\u25BC  Voice / Text Prompt  \u25BC", font_size=14, color=LIGHT_GRAY, alignment=PP_ALIGN.CENTER)
+
+    # DGX Spark
+    add_device_box(slide, 4.2, 2.2, 4.9, 1.5,
+        "DGX SPARK", "Agent C: The Overlord",
+        "Local LLM \u2022 Task decomposition \u2022 Orchestration", NVIDIA_GREEN)
+
+    # Arrow down left
+    add_textbox(slide, 3.0, 3.75, 2.5, 0.4, "subtasks \u25BC", font_size=12, color=LIGHT_GRAY, alignment=PP_ALIGN.CENTER)
+    # Arrow down right
+    add_textbox(slide, 7.8, 3.75, 2.5, 0.4, "validation requests \u25BC", font_size=12, color=LIGHT_GRAY, alignment=PP_ALIGN.CENTER)
+
+    # Jetson (bottom left)
+    add_device_box(slide, 0.8, 4.2, 5.0, 1.8,
+        "JETSON ORIN NANO", "Agent A: The Builder",
+        "VLM perception \u2022 Motor control \u2022 Camera feed\n\u2192 Drives SO-101 Follower Arm", ACCENT_BLUE)
+
+    # Isaac Sim (bottom right)
+    add_device_box(slide, 7.5, 4.2, 5.0, 1.8,
+        "RTX 3070 \u2014 ISAAC SIM", "Agent B: The Architect",
+        "Physics simulation \u2022 Stress testing \u2022 Validation\n\u2192 Digital Twin of workspace", NVIDIA_GREEN)
+
+    # Feedback arrow
+    add_textbox(slide, 4.0, 6.1, 5.3, 0.4, "\u25C0\u2500\u2500 feedback loop \u2500\u2500\u25B6", font_size=14, color=ACCENT_RED, alignment=PP_ALIGN.CENTER)
+
+    # Agent D note
+    add_textbox(slide, 0.8, 6.6, 11.7, 0.6,
+        "Agent D: The Operator \u2014 Human override via Leader Arm for safety-critical fallback",
+        font_size=14, color=LIGHT_GRAY, alignment=PP_ALIGN.CENTER)
+
+    # ============================================================
+    # SLIDE 7: Why Edge + Hardware
+    # (Merged old "Why Edge Matters" and "Hardware" slides)
+    # ============================================================
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    set_slide_bg(slide, BG_DARK)
+    add_textbox(slide, 0.8, 0.4, 11.7, 0.8, "WHY EDGE MATTERS", font_size=14, color=NVIDIA_GREEN, bold=True)
+    add_accent_line(slide, 0.8, 0.8, 2)
+    tf = add_textbox(slide, 0.8, 1.0, 11.7, 0.6,
+        "Hardware-native. Designed for environments where cloud doesn't exist.",
+        font_size=26, color=WHITE, bold=True)
+
+    # Comparison table (compact)
+    rows = [
+        ["", "Cloud", "Edge Rescue"],
+        ["Internet", "Required", "Not needed"],
+        ["Latency", "100\u2013500ms", "<10ms"],
+        ["Disaster zone", "Unusable", "Designed for it"],
+        ["Physics validation", "None", "Every action"],
+        ["Single point of failure", "Cloud outage", "Self-contained"],
+    ]
+    tbl = add_data_table(slide, rows, 0.8, 1.8, 6.0, 3.5, font_size=12,
+                         col_colors=[WHITE, ACCENT_RED, NVIDIA_GREEN], bold_cols=(0, 2))
+
+    tbl.columns[0].width = Inches(2.0)
+    tbl.columns[1].width = Inches(2.0)
+    tbl.columns[2].width = Inches(2.0)
+
+    # Hardware list (right side)
+    add_textbox(slide, 7.3, 1.8, 5.5, 0.4, "HARDWARE ON THE TABLE", font_size=14, color=NVIDIA_GREEN, bold=True)
+
+    hw_items = [
+        ("NVIDIA DGX Spark", "Local LLM \u2014 planning + orchestration"),
+        ("NVIDIA Jetson Orin Nano Super", "VLM perception + motor control"),
+        ("RTX 3070 Laptop", "Isaac Sim \u2014 physics validation"),
+        ("SO-101 Follower Arm", "Executes validated plans"),
+        ("SO-101 Leader Arm", "Human override for edge cases"),
+        ("2x Mono Cameras", "Stereo perception \u2192 digital twin"),
+    ]
+
+    hy = 2.3
+    for device, role in hw_items:
+        add_textbox(slide, 7.3, hy, 5.5, 0.3, device, font_size=14, color=WHITE, bold=True)
+        add_textbox(slide, 7.3, hy + 0.3, 5.5, 0.3, role, font_size=12, color=LIGHT_GRAY)
+        hy += 0.7
+
+    # ============================================================
+    # SLIDE 8: The Market
+    # ============================================================
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    set_slide_bg(slide, BG_DARK)
+    add_textbox(slide, 0.8, 0.4, 11.7, 0.8, "THE MARKET", font_size=14, color=NVIDIA_GREEN, bold=True)
+    add_accent_line(slide, 0.8, 0.8, 2)
+    add_textbox(slide, 0.8, 1.0, 11.7, 0.7,
+        "At the intersection of three rapidly growing markets.",
+        font_size=28, color=WHITE, bold=True)
+
+    col_data = [
+        ("Disaster Response\nRobotics", "$2.5B \u2192 $6.2B", "by 2033 (10.5% CAGR)", "Search & rescue robots:\n$35.3B in 2025\n$70.3B by 2030", ACCENT_RED),
+        ("Digital Twin\nTechnology", "$35.8B \u2192 $328.5B", "by 2034 (31.1% CAGR)", "NVIDIA Omniverse deployed\nby TSMC, BMW, Siemens\nfor factory digital twins", ACCENT_BLUE),
+        ("Edge AI\nfor Robotics", "$1.2 Trillion", "in 2025 US manufacturing\ninvestment", "NVIDIA Jetson, Isaac Sim,\nDGX Spark all built for\nexactly this use case", NVIDIA_GREEN),
+    ]
+
+    x = 0.8
+    for title, big_num, subtitle, details, color in col_data:
+        shape = slide.shapes.add_shape(
+            MSO_SHAPE.ROUNDED_RECTANGLE, Inches(x), Inches(2.0), Inches(3.7), Inches(4.8)
+        )
+        shape.fill.solid()
+        shape.fill.fore_color.rgb = RGBColor(0x1A, 0x1A, 0x2E)
+        shape.line.color.rgb = color
+        shape.line.width = Pt(2)
+
+        add_textbox(slide, x + 0.2, 2.15, 3.3, 0.8, title, font_size=18, color=color, bold=True, alignment=PP_ALIGN.CENTER)
+        add_textbox(slide, x + 0.2, 3.1, 3.3, 0.6, big_num, font_size=28, color=WHITE, bold=True, alignment=PP_ALIGN.CENTER)
+        add_textbox(slide, x + 0.2, 3.8, 3.3, 0.6, subtitle, font_size=13, color=LIGHT_GRAY, alignment=PP_ALIGN.CENTER)
+        add_textbox(slide, x + 0.2, 4.6, 3.3, 1.5, details, font_size=13, color=LIGHT_GRAY, alignment=PP_ALIGN.CENTER)
+        x += 4.1
+
+    add_textbox(slide, 0.8, 6.9, 11.7, 0.4,
+        "Sources: Verified Market Reports, Mordor Intelligence, GM Insights, NVIDIA Newsroom",
+        font_size=11, color=RGBColor(0x66, 0x66, 0x66), alignment=PP_ALIGN.CENTER)
+
+    # ============================================================
+    # SLIDE 9: Beyond Disaster Response
+    # ============================================================
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    set_slide_bg(slide, BG_DARK)
+    add_textbox(slide, 0.8, 0.4, 11.7, 0.8, "BEYOND DISASTER RESPONSE", font_size=14, color=NVIDIA_GREEN, bold=True)
+    add_accent_line(slide, 0.8, 0.8, 2)
+    add_textbox(slide, 0.8, 1.0, 11.7, 0.7,
+        "The demo is blocks. The architecture is universal.",
+        font_size=28, color=WHITE, bold=True)
+
+    applications = [
+        ("Hazmat Decommissioning", "Test a cutting procedure in sim before committing a robot in a radioactive environment"),
+        ("Remote Space Construction", "Build a habitat in sim on Earth, execute on Mars where 20-min signal delay makes teleoperation impossible"),
+        ("Precision Manufacturing", "Simulate micro-assembly before a robot places a component worth thousands of dollars"),
+        ("Infrastructure Inspection", "Simulate load redistribution before a robot removes a damaged bridge section"),
+    ]
+
+    y = 2.2
+    for title, desc in applications:
+        shape = slide.shapes.add_shape(
+            MSO_SHAPE.ROUNDED_RECTANGLE, Inches(0.8), Inches(y), Inches(11.7), Inches(1.0)
+        )
+        shape.fill.solid()
+        shape.fill.fore_color.rgb = RGBColor(0x1A, 0x1A, 0x2E)
+        shape.line.color.rgb = RGBColor(0x33, 0x33, 0x50)
+        shape.line.width = Pt(1)
+
+        add_textbox(slide, 1.0, y + 0.05, 3.5, 0.5, title, font_size=18, color=WHITE, bold=True)
+        add_textbox(slide, 1.0, y + 0.5, 10.3, 0.45, desc, font_size=14, color=LIGHT_GRAY)
+        y += 1.15
+
+    tf = add_textbox(slide, 0.8, 6.5, 11.7, 0.8,
+        "The prompt changes. The manipulator changes. The physics engine stays the same.\nIf you can simulate it, you can validate it. If you can validate it, you can trust a robot to do it.",
+        font_size=18, color=NVIDIA_GREEN, bold=True, alignment=PP_ALIGN.CENTER)
+
+    # ============================================================
+    # SLIDE 10: Live Demo
+    # ============================================================
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    set_slide_bg(slide, BG_SECTION)
+
+    add_textbox(slide, 1, 2.2, 11.333, 1.2, "LIVE DEMO", font_size=54, color=WHITE, bold=True, alignment=PP_ALIGN.CENTER)
+    add_accent_line(slide, 4.5, 3.5, 4.333)
+    add_textbox(slide, 1, 3.8, 11.333, 1.0,
+        "Build a tower. Break it in simulation.\nRedesign it. Rebuild it stronger.",
+        font_size=24, color=NVIDIA_GREEN, alignment=PP_ALIGN.CENTER)
+
+    # ============================================================
+    # SLIDE 11: Closing
+    # ============================================================
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    set_slide_bg(slide, BG_DARK)
+
+    add_textbox(slide, 1, 1.0, 11.333, 1.0, "Edge Rescue", font_size=48, color=WHITE, bold=True, alignment=PP_ALIGN.CENTER)
+    add_accent_line(slide, 4, 2.1, 5.333)
+
+    add_textbox(slide, 1.5, 2.5, 10.333, 2.0,
+        "An AI system that plans a construction task, simulates it to check for structural failure, and only then tells the robot to build.\n\nIf the simulation says it'll collapse in an earthquake, the AI redesigns it and the robot rebuilds.",
+        font_size=22, color=LIGHT_GRAY, alignment=PP_ALIGN.CENTER)
+
+    add_textbox(slide, 1, 4.8, 11.333, 0.6,
+        "Fully local.  Fully autonomous.  Physics-validated safety.",
+        font_size=24, color=NVIDIA_GREEN, bold=True, alignment=PP_ALIGN.CENTER)
+
+    add_textbox(slide, 1, 5.8, 11.333, 0.6,
+        "Built for the places where cloud doesn't reach and mistakes cost lives.",
+        font_size=20, color=WHITE, alignment=PP_ALIGN.CENTER)
+
+    add_textbox(slide, 1, 6.5, 11.333, 0.5,
+        "Eashan Iyer  |  Samuel Lihn  |  Gordon Jin  |  Trevor Kwan",
+        font_size=16, color=LIGHT_GRAY, alignment=PP_ALIGN.CENTER)
+
+    # ============================================================
+    # SLIDE 12: Prize Track Alignment (Appendix)
+    # ============================================================
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    set_slide_bg(slide, BG_DARK)
+    add_textbox(slide, 0.8, 0.4, 11.7, 0.8, "APPENDIX: PRIZE TRACK ALIGNMENT", font_size=14, color=NVIDIA_GREEN, bold=True)
+    add_accent_line(slide, 0.8, 0.8, 2)
+
+    prizes = [
+        ["Prize", "Why We Fit"],
+        ["NVIDIA Edge AI Track", "DGX Spark + Jetson + Isaac Sim \u2014 the full NVIDIA edge stack in one project"],
+        ["NVIDIA Open Models Challenge", "Multi-agent system built on NVIDIA open models and hardware"],
+        ["Best Hardware Hack", "3 NVIDIA compute devices + 2 robot arms + stereo cameras on the table"],
+        ["Most Technically Complex", "Local LLM + VLA + physics sim + multi-agent orchestration across 3 devices"],
+        ["Greylock Best Multi-Turn Agent", "4 agents reasoning about feedback to dynamically complete multi-step construction"],
+        ["Grand Prize", "Innovation + technical complexity + social impact demonstrated in a single live demo"],
+    ]
+    tbl = add_data_table(slide, prizes, 0.8, 1.3, 11.7, 5.5, font_size=14,
+                         col_colors=[WHITE, LIGHT_GRAY])
+
+    tbl.columns[0].width = Inches(4.0)
+    tbl.columns[1].width = Inches(7.7)
 
 # ============================================================
-# SLIDE 9: Beyond Disaster Response
+# MARKDOWN DECK (incremental build)
 # ============================================================
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-set_slide_bg(slide, BG_DARK)
-add_textbox(slide, 0.8, 0.4, 11.7, 0.8, "BEYOND DISASTER RESPONSE", font_size=14, color=NVIDIA_GREEN, bold=True)
-add_accent_line(slide, 0.8, 0.8, 2)
-add_textbox(slide, 0.8, 1.0, 11.7, 0.7,
-    "The demo is blocks. The architecture is universal.",
-    font_size=28, color=WHITE, bold=True)
-
-applications = [
-    ("Hazmat Decommissioning", "Test a cutting procedure in sim before committing a robot in a radioactive environment"),
-    ("Remote Space Construction", "Build a habitat in sim on Earth, execute on Mars where 20-min signal delay makes teleoperation impossible"),
-    ("Precision Manufacturing", "Simulate micro-assembly before a robot places a component worth thousands of dollars"),
-    ("Infrastructure Inspection", "Simulate load redistribution before a robot removes a damaged bridge section"),
-]
+SLIDE_HEADING = re.compile(r"^##\s+(?:SLIDE\s+\d+:\s*)?(.+)$")
+LIST_ITEM = re.compile(r"^(\s*)(?:[-*]|(\d+)\.)\s+(.*)$")
+TABLE_RULE = re.compile(r"^[\s|:-]+$")
+INLINE_MARKUP = re.compile(r"(\*\*[^*]+\*\*|\*[^*]+\*)")
+
+
+def parse_markdown_deck(text):
+    """Split presentation.md on `---` into slides made of plain, JSON-able blocks."""
+    slides = []
+    for section in re.split(r"^---\s*$", text, flags=re.M):
+        lines = section.strip("\n").split("\n")
+        heading = next((i for i, l in enumerate(lines) if l.startswith("## ")), None)
+        if heading is None:
+            continue  # deck header (# title lines)
+        slides.append({
+            "title": SLIDE_HEADING.match(lines[heading]).group(1).strip(),
+            "layout": "title" if not slides else "content",
+            "blocks": _parse_blocks(lines[heading + 1:]),
+        })
+    return slides
+
+
+def _parse_blocks(lines):
+    blocks = []
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        stripped = line.strip()
+        if not stripped:
+            i += 1
+        elif stripped.startswith("```"):
+            end = i + 1
+            while end < len(lines) and not lines[end].strip().startswith("```"):
+                end += 1
+            blocks.append({"kind": "code", "lines": lines[i + 1:end]})
+            i = end + 1
+        elif stripped.startswith("|"):
+            rows = []
+            while i < len(lines) and lines[i].strip().startswith("|"):
+                row = lines[i].strip()
+                if not TABLE_RULE.match(row):
+                    rows.append([c.strip() for c in row.strip("|").split("|")])
+                i += 1
+            blocks.append({"kind": "table", "rows": rows})
+        elif stripped.startswith("[") and stripped.endswith("]"):
+            i += 1  # stage direction for the presenter, not slide content
+        else:
+            m = LIST_ITEM.match(line)
+            if m:
+                item = {
+                    "marker": f"{m.group(2)}." if m.group(2) else "\u2022",
+                    "level": len(m.group(1)) // 2,
+                    "text": m.group(3),
+                }
+                if blocks and blocks[-1]["kind"] == "list":
+                    blocks[-1]["items"].append(item)
+                else:
+                    blocks.append({"kind": "list", "items": [item]})
+            else:
+                blocks.append({"kind": "text", "text": stripped})
+            i += 1
+    return blocks
+
+
+def _is_strong(text):
+    return text.startswith("**") and text.endswith("**") and text.count("**") == 2
+
+
+def _plain(text):
+    return INLINE_MARKUP.sub(lambda m: m.group(0).strip("*"), text)
+
+
+def _text_height(text, font_size, width):
+    """Rough box height in inches, assuming an average glyph is half an em wide."""
+    per_line = max(1, int(width * 144 / font_size))
+    lines = sum(max(1, -(-len(part) // per_line)) for part in text.split("\n"))
+    return lines * font_size * 1.25 / 72 + 0.1
+
+
+def add_rich_paragraph(tf, text, font_size=16, color=LIGHT_GRAY, strong_color=WHITE,
+                       alignment=PP_ALIGN.LEFT, space_before=0, level=0, first=False):
+    """Like add_paragraph, but renders **bold** / *italic* spans as separate runs."""
+    p = tf.paragraphs[0] if first else tf.add_paragraph()
+    p.alignment = alignment
+    p.level = level
+    if space_before:
+        p.space_before = Pt(space_before)
+    for part in INLINE_MARKUP.split(text):
+        if not part:
+            continue
+        run = p.add_run()
+        if part.startswith("**") and part.endswith("**"):
+            run.text = part[2:-2]
+            run.font.bold = True
+            run.font.color.rgb = strong_color
+        elif part.startswith("*") and part.endswith("*"):
+            run.text = part[1:-1]
+            run.font.italic = True
+            run.font.color.rgb = color
+        else:
+            run.text = part
+            run.font.color.rgb = color
+        run.font.size = Pt(font_size)
+        run.font.name = "Calibri"
+    return p
 
-y = 2.2
-for title, desc in applications:
-    shape = slide.shapes.add_shape(
-        MSO_SHAPE.ROUNDED_RECTANGLE, Inches(0.8), Inches(y), Inches(11.7), Inches(1.0)
-    )
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = RGBColor(0x1A, 0x1A, 0x2E)
-    shape.line.color.rgb = RGBColor(0x33, 0x33, 0x50)
-    shape.line.width = Pt(1)
 
-    add_textbox(slide, 1.0, y + 0.05, 3.5, 0.5, title, font_size=18, color=WHITE, bold=True)
-    add_textbox(slide, 1.0, y + 0.5, 10.3, 0.45, desc, font_size=14, color=LIGHT_GRAY)
-    y += 1.15
+def _render_md_text(slide, block, y):
+    text = block["text"]
+    if _is_strong(text):
+        size, color = 22, WHITE
+    else:
+        size, color = 16, LIGHT_GRAY
+    h = _text_height(_plain(text), size, 11.7)
+    tf = add_textbox(slide, 0.8, y, 11.7, h, "", font_size=size)
+    add_rich_paragraph(tf, text, font_size=size, color=color, first=True)
+    return y + h + 0.1
+
+
+def _render_md_list(slide, block, y):
+    items = block["items"]
+    h = sum(_text_height(_plain(it["text"]), 16, 11.7 - 0.4 * it["level"]) for it in items)
+    tf = add_textbox(slide, 0.8, y, 11.7, h, "", font_size=16)
+    for n, it in enumerate(items):
+        size = 16 if it["level"] == 0 else 13
+        add_rich_paragraph(tf, f"{it['marker']}  {it['text']}", font_size=size,
+                           level=it["level"], space_before=0 if n == 0 else 4, first=n == 0)
+    return y + h + 0.15
+
+
+def _render_md_table(slide, block, y):
+    rows = [[_plain(text) for text in row] for row in block["rows"]]
+    cols = max(len(r) for r in rows)
+    row_h = 0.45
+    add_data_table(slide, rows, 0.8, y, 11.7, row_h * len(rows), font_size=12,
+                   col_colors=[WHITE] + [LIGHT_GRAY] * (cols - 1))
+    return y + row_h * len(rows) + 0.2
+
+
+def _render_md_code(slide, block, y):
+    text = "\n".join(block["lines"])
+    h = len(block["lines"]) * 10 * 1.2 / 72 + 0.1
+    add_textbox(slide, 0.8, y, 11.7, h, text, font_size=10, color=LIGHT_GRAY, font_name="Consolas")
+    return y + h + 0.1
+
+
+MD_BLOCK_RENDERERS = {
+    "text": _render_md_text,
+    "list": _render_md_list,
+    "table": _render_md_table,
+    "code": _render_md_code,
+}
+
+
+def render_md_slide(slide, spec):
+    set_slide_bg(slide, BG_DARK)
+    if spec["layout"] == "title":
+        add_accent_line(slide, 3, 1.8, 7.333)
+        y = 2.0
+        for block in spec["blocks"]:
+            text = block.get("text", "")
+            if _is_strong(text):
+                size, color = 54, WHITE
+            elif text.startswith("*"):
+                size, color = 28, NVIDIA_GREEN
+            else:
+                size, color = 18, LIGHT_GRAY
+            h = _text_height(_plain(text), size, 11.333)
+            add_textbox(slide, 1, y, 11.333, h, _plain(text), font_size=size, color=color,
+                        bold=size == 54, alignment=PP_ALIGN.CENTER)
+            y += h
+        return
+
+    add_textbox(slide, 0.8, 0.4, 11.7, 0.8, spec["title"].upper(), font_size=14, color=NVIDIA_GREEN, bold=True)
+    add_accent_line(slide, 0.8, 0.8, 2)
+    y = 1.1
+    for block in spec["blocks"]:
+        y = MD_BLOCK_RENDERERS[block["kind"]](slide, block, y)
+    if y > 7.6:
+        print(f"[deck] warning: \"{spec['title']}\" runs {y - 7.5:.1f}in past the slide bottom")
+
+
+# Everything that decides how a parsed slide looks; editing any of these
+# (or the palette) invalidates the cached slide XML.
+MD_STYLE_FUNCS = [
+    set_slide_bg, add_textbox, add_paragraph, add_table, add_accent_line,
+    _cell_proto, _set_cell_text, fill_table, add_data_table, _is_strong, _plain, _text_height, add_rich_paragraph, render_md_slide,
+    *MD_BLOCK_RENDERERS.values(),
+]
+
+# Everything that decides how markdown turns into slide specs; editing any of
+# these invalidates the parsed slides kept in the manifest.
+MD_PARSER_FUNCS = [parse_markdown_deck, _parse_blocks]
+MD_PATTERNS = [SLIDE_HEADING, LIST_ITEM, TABLE_RULE, INLINE_MARKUP]
+
+
+def _code_fingerprint(funcs):
+    h = hashlib.sha256()
+    for fn in funcs:
+        h.update(inspect.getsource(fn).encode())
+    h.update(repr([(p.pattern, p.flags) for p in MD_PATTERNS]).encode())
+    return h
+
+
+def parse_key(raw):
+    h = _code_fingerprint(MD_PARSER_FUNCS)
+    h.update(raw)
+    return h.hexdigest()
+
+
+def style_fingerprint():
+    h = _code_fingerprint(MD_STYLE_FUNCS)
+    palette = sorted((k, str(v)) for k, v in globals().items() if isinstance(v, RGBColor))
+    h.update(repr(palette).encode())
+    return h.hexdigest()
+
+
+def slide_hash(spec, style):
+    content = json.dumps(spec, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256((style + content).encode()).hexdigest()[:20]
+
+
+def _load_manifest(cache_dir):
+    try:
+        with open(os.path.join(cache_dir, "manifest.json"), encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def build_from_markdown(md_path, out_path, cache_dir=CACHE_DIR, force=False):
+    """Build a deck from markdown, re-rendering only slides whose hash changed.
+
+    Slides drawn from markdown only hold shapes, text and tables, so their
+    <p:cSld> element has no relationships and can be cached and spliced
+    into a fresh blank slide verbatim.
+    """
+    t0 = time.perf_counter()
+    with open(md_path, "rb") as f:
+        raw = f.read()
+    source_key = parse_key(raw)
+
+    manifest = {} if force else _load_manifest(cache_dir)
+    if manifest.get("parse_key") == source_key:
+        slides = manifest["slides"]
+    else:
+        slides = parse_markdown_deck(raw.decode("utf-8"))
+
+    style = style_fingerprint()
+    hashes = [slide_hash(spec, style) for spec in slides]
+    out_abs = os.path.abspath(out_path)
+    if (hashes == manifest.get("hashes") and manifest.get("output") == out_abs
+            and os.path.exists(out_path)):
+        print(f"[deck] {out_path} is up to date ({(time.perf_counter() - t0) * 1000:.0f} ms)")
+        return
+
+    slide_dir = os.path.join(cache_dir, "slides")
+    os.makedirs(slide_dir, exist_ok=True)
+    prs = new_presentation()
+    layout = prs.slide_layouts[BLANK_LAYOUT]
+    rendered = 0
+    for spec, digest in zip(slides, hashes):
+        slide = prs.slides.add_slide(layout)
+        xml_path = os.path.join(slide_dir, digest + ".xml")
+        if not force and os.path.exists(xml_path):
+            with open(xml_path, "rb") as f:
+                slide._element.replace(slide._element.cSld, parse_xml(f.read()))
+        else:
+            render_md_slide(slide, spec)
+            with open(xml_path, "wb") as f:
+                f.write(etree.tostring(slide._element.cSld))
+            rendered += 1
+    prs.save(out_path)
+
+    # Drop slide XML no longer referenced by the deck
+    keep = {digest + ".xml" for digest in hashes}
+    for name in os.listdir(slide_dir):
+        if name not in keep:
+            os.remove(os.path.join(slide_dir, name))
+
+    tmp = os.path.join(cache_dir, "manifest.json.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"parse_key": source_key, "slides": slides, "hashes": hashes, "output": out_abs}, f)
+    os.replace(tmp, os.path.join(cache_dir, "manifest.json"))
+
+    elapsed = (time.perf_counter() - t0) * 1000
+    print(f"[deck] {rendered}/{len(slides)} slides rendered, "
+          f"{len(slides) - rendered} from cache -> {out_path} ({elapsed:.0f} ms)")
 
-tf = add_textbox(slide, 0.8, 6.5, 11.7, 0.8,
-    "The prompt changes. The manipulator changes. The physics engine stays the same.\nIf you can simulate it, you can validate it. If you can validate it, you can trust a robot to do it.",
-    font_size=18, color=NVIDIA_GREEN, bold=True, alignment=PP_ALIGN.CENTER)
 
 # ============================================================
-# SLIDE 10: Live Demo
+# TABLE BENCHMARK
 # ============================================================
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-set_slide_bg(slide, BG_SECTION)
+def bench_tables(rows=300, cols=10, repeat=3):
+    """Time style_cell-per-cell against fill_table on a rows x cols table."""
+    data = [[f"r{r}c{c}" for c in range(cols)] for r in range(rows)]
+    col_colors = [WHITE] + [LIGHT_GRAY] * (cols - 1)
+
+    def per_cell(tbl):
+        for c in range(cols):
+            style_cell(tbl.cell(0, c), data[0][c], font_size=13, bold=True, color=NVIDIA_GREEN, bg_color=TABLE_HEADER_BG)
+        for r in range(1, rows):
+            bg = TABLE_ROW_BG if (r - 1) % 2 == 0 else TABLE_ALT_BG
+            for c in range(cols):
+                style_cell(tbl.cell(r, c), data[r][c], font_size=12, color=col_colors[c], bold=c == 0, bg_color=bg)
+
+    def bulk(tbl):
+        fill_table(tbl, data, font_size=12, col_colors=col_colors)
+
+    results = {}
+    for name, fn in (("style_cell", per_cell), ("fill_table", bulk)):
+        best = float("inf")
+        for _ in range(repeat):
+            prs = new_presentation()
+            tbl = add_table(prs.slides.add_slide(prs.slide_layouts[BLANK_LAYOUT]), rows, cols, 0, 0, 13, 7)
+            t0 = time.perf_counter()
+            fn(tbl)
+            best = min(best, time.perf_counter() - t0)
+        results[name] = (best, etree.tostring(tbl._tbl))
+
+    assert results["style_cell"][1] == results["fill_table"][1], "fill_table XML differs from style_cell"
+    slow, fast = results["style_cell"][0], results["fill_table"][0]
+    print(f"[bench] {rows}x{cols} = {rows * cols} cells, best of {repeat}")
+    print(f"[bench]   style_cell  {slow * 1000:8.1f} ms  ({slow / (rows * cols) * 1e6:.1f} us/cell)")
+    print(f"[bench]   fill_table  {fast * 1000:8.1f} ms  ({fast / (rows * cols) * 1e6:.1f} us/cell)  {slow / fast:.1f}x faster")
 
-add_textbox(slide, 1, 2.2, 11.333, 1.2, "LIVE DEMO", font_size=54, color=WHITE, bold=True, alignment=PP_ALIGN.CENTER)
-add_accent_line(slide, 4.5, 3.5, 4.333)
-add_textbox(slide, 1, 3.8, 11.333, 1.0,
-    "Build a tower. Break it in simulation.\nRedesign it. Rebuild it stronger.",
-    font_size=24, color=NVIDIA_GREEN, alignment=PP_ALIGN.CENTER)
 
 # ============================================================
-# SLIDE 11: Closing
+# SAVE
 # ============================================================
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-set_slide_bg(slide, BG_DARK)
+EDGE_RESCUE_OUT = r"C:\Users\Dell\Desktop\treehacks2026\EdgeRescue_TreeHacks2026.pptx"
 
-add_textbox(slide, 1, 1.0, 11.333, 1.0, "Edge Rescue", font_size=48, color=WHITE, bold=True, alignment=PP_ALIGN.CENTER)
-add_accent_line(slide, 4, 2.1, 5.333)
 
-add_textbox(slide, 1.5, 2.5, 10.333, 2.0,
-    "An AI system that plans a construction task, simulates it to check for structural failure, and only then tells the robot to build.\n\nIf the simulation says it'll collapse in an earthquake, the AI redesigns it and the robot rebuilds.",
-    font_size=22, color=LIGHT_GRAY, alignment=PP_ALIGN.CENTER)
+def main():
+    parser = argparse.ArgumentParser(description="Build the TreeHacks pitch decks.")
+    parser.add_argument("--md", help="build incrementally from a markdown deck (e.g. presentation.md)")
+    parser.add_argument("--out", help="output .pptx path")
+    parser.add_argument("--force", action="store_true", help="ignore .deck_cache and re-render every slide")
+    parser.add_argument("--bench-tables", metavar="ROWSxCOLS", nargs="?", const="300x10",
+                        help="benchmark style_cell vs fill_table (default 300x10) and exit")
+    args = parser.parse_args()
 
-add_textbox(slide, 1, 4.8, 11.333, 0.6,
-    "Fully local.  Fully autonomous.  Physics-validated safety.",
-    font_size=24, color=NVIDIA_GREEN, bold=True, alignment=PP_ALIGN.CENTER)
+    if args.bench_tables:
+        rows, cols = (int(n) for n in args.bench_tables.lower().split("x"))
+        bench_tables(rows, cols)
+        return
 
-add_textbox(slide, 1, 5.8, 11.333, 0.6,
-    "Built for the places where cloud doesn't reach and mistakes cost lives.",
-    font_size=20, color=WHITE, alignment=PP_ALIGN.CENTER)
+    if args.md:
+        out = args.out or os.path.splitext(args.md)[0] + ".pptx"
+        build_from_markdown(args.md, out, force=args.force)
+        return
 
-add_textbox(slide, 1, 6.5, 11.333, 0.5,
-    "Eashan Iyer  |  Samuel Lihn  |  Gordon Jin  |  Trevor Kwan",
-    font_size=16, color=LIGHT_GRAY, alignment=PP_ALIGN.CENTER)
+    prs = new_presentation()
+    build_edge_rescue(prs)
+    output_path = args.out or EDGE_RESCUE_OUT
+    prs.save(output_path)
+    print(f"Saved to {output_path}")
 
-# ============================================================
-# SLIDE 12: Prize Track Alignment (Appendix)
-# ============================================================
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-set_slide_bg(slide, BG_DARK)
-add_textbox(slide, 0.8, 0.4, 11.7, 0.8, "APPENDIX: PRIZE TRACK ALIGNMENT", font_size=14, color=NVIDIA_GREEN, bold=True)
-add_accent_line(slide, 0.8, 0.8, 2)
-
-tbl = add_table(slide, 7, 2, 0.8, 1.3, 11.7, 5.5)
-style_cell(tbl.cell(0, 0), "Prize", font_size=15, bold=True, color=NVIDIA_GREEN, bg_color=TABLE_HEADER_BG)
-style_cell(tbl.cell(0, 1), "Why We Fit", font_size=15, bold=True, color=NVIDIA_GREEN, bg_color=TABLE_HEADER_BG)
-
-prizes = [
-    ["NVIDIA Edge AI Track", "DGX Spark + Jetson + Isaac Sim \u2014 the full NVIDIA edge stack in one project"],
-    ["NVIDIA Open Models Challenge", "Multi-agent system built on NVIDIA open models and hardware"],
-    ["Best Hardware Hack", "3 NVIDIA compute devices + 2 robot arms + stereo cameras on the table"],
-    ["Most Technically Complex", "Local LLM + VLA + physics sim + multi-agent orchestration across 3 devices"],
-    ["Greylock Best Multi-Turn Agent", "4 agents reasoning about feedback to dynamically complete multi-step construction"],
-    ["Grand Prize", "Innovation + technical complexity + social impact demonstrated in a single live demo"],
-]
-for r, row in enumerate(prizes):
-    bg = TABLE_ROW_BG if r % 2 == 0 else TABLE_ALT_BG
-    style_cell(tbl.cell(r+1, 0), row[0], font_size=14, color=WHITE, bold=True, bg_color=bg)
-    style_cell(tbl.cell(r+1, 1), row[1], font_size=14, color=LIGHT_GRAY, bg_color=bg)
 
-tbl.columns[0].width = Inches(4.0)
-tbl.columns[1].width = Inches(7.7)
+if __name__ == "__main__":
+    main()
 
-# ============================================================
-# SAVE
-# ============================================================
-output_path = r"C:\Users\Dell\Desktop\treehacks2026\EdgeRescue_TreeHacks2026.pptx"
-prs.save(output_path)
-print(f"Saved to {output_path}")
@@ -1,6 +1,7 @@
 // ---- CONFIG ----
 const SPARK_IP = "100.123.79.38";
 const BRIDGE_URL = `http://${SPARK_IP}:9090`;
+const CONTROL_URL = `http://${SPARK_IP}:9091`;  // control lane: goals aren't queued behind viewers
 
 // ---- DOM ----
 const messagesEl = document.getElementById("messages");
@@ -32,7 +33,9 @@ function log(message, level = "info") {
 
 // ---- STATE ----
 let planSteps = [];
-let currentSubtask = "";
+let planStepEls = [];
+let missionId = null;
+let lastSeq = 0;
 let evtSource = null;
 
 // ---- HELPERS ----
@@ -56,19 +59,24 @@ function renderPlan() {
         return;
     }
     planView.innerHTML = "";
-    planSteps.forEach((step, i) => {
+    planStepEls = planSteps.map((step, i) => {
         const div = document.createElement("div");
-        div.className = "plan-step";
-
-        if (step.status === "done") {
-            div.classList.add("done");
-        } else if (step.status === "active") {
-            div.classList.add("active");
-        }
-
         div.textContent = `${i + 1}. ${step.label}`;
         planView.appendChild(div);
+        return div;
     });
+    planSteps.forEach((_, i) => renderStep(i));
+}
+
+function renderStep(i) {
+    const div = planStepEls[i];
+    if (!div) return;
+    div.className = "plan-step";
+    if (planSteps[i].status === "done") {
+        div.classList.add("done");
+    } else if (planSteps[i].status === "active") {
+        div.classList.add("active");
+    }
 }
 
 // ---- SSE CONNECTION ----
@@ -76,52 +84,74 @@ let connectAttempt = 0;
 
 function connectSSE() {
     connectAttempt++;
-    log(`SSE connection attempt #${connectAttempt} to ${BRIDGE_URL}/events`, "info");
+    log(`SSE connection attempt #${connectAttempt} to ${BRIDGE_URL}/events?v=2`, "info");
 
-    evtSource = new EventSource(`${BRIDGE_URL}/events`);
+    evtSource = new EventSource(`${BRIDGE_URL}/events?v=2`);
 
     evtSource.onopen = () => {
         connectAttempt = 0;
+        lastSeq = 0;
         setStatus(true);
         addMessage("Connected to DGX Spark.", "system");
         log(`SSE connected to ${BRIDGE_URL}/events`, "ok");
     };
 
-    evtSource.addEventListener("plan", (e) => {
-        log(`plan received: ${e.data.substring(0, 200)}`, "info");
-        try {
-            const plan = JSON.parse(e.data);
-            planSteps = (Array.isArray(plan) ? plan : [plan]).map((s) => {
-                if (typeof s === "string") return { label: s, status: "pending" };
-                return { label: s.label || s.task || JSON.stringify(s), status: s.status || "pending" };
-            });
-            renderPlan();
+    // Protocol v2: every event is JSON {v, seq, type, mission, ...}
+    function onEvent(type, handler) {
+        evtSource.addEventListener(type, (e) => {
+            let ev;
+            try {
+                ev = JSON.parse(e.data);
+            } catch (err) {
+                log(`${type} parse error: ${err.message}`, "warn");
+                return;
+            }
+            if (lastSeq && ev.seq > lastSeq + 1) {
+                log(`missed ${ev.seq - lastSeq - 1} event(s) before #${ev.seq}`, "warn");
+            }
+            lastSeq = Math.max(lastSeq, ev.seq);
+            if (type !== "plan" && ev.mission !== missionId) return;
+            handler(ev);
+        });
+    }
+
+    onEvent("plan", (ev) => {
+        log(`plan received for mission ${ev.mission}: ${ev.steps.length} steps`, "info");
+        const isNew = ev.mission !== missionId;
+        missionId = ev.mission;
+        planSteps = ev.steps.map((label, i) => ({ label, status: ev.status[i] || "pending" }));
+        renderPlan();
+        const active = planSteps.find((s) => s.status === "active");
+        subtaskLabel.textContent = ev.state === "done" ? "Done." : active ? active.label : "Planning...";
+        if (isNew) {
             addMessage("Plan received:\n" + planSteps.map((s, i) => `  ${i + 1}. ${s.label}`).join("\n"), "assistant");
-        } catch (err) {
-            log(`plan parse error: ${err.message}`, "warn");
-            addMessage(e.data, "assistant");
         }
     });
 
-    evtSource.addEventListener("subtask", (e) => {
-        log(`subtask: ${e.data}`, "info");
-        currentSubtask = e.data;
-        subtaskLabel.textContent = currentSubtask;
-
-        let foundCurrent = false;
-        planSteps.forEach((step) => {
-            if (foundCurrent) {
-                step.status = "pending";
-            } else if (step.label === currentSubtask || currentSubtask.includes(step.label)) {
-                step.status = "active";
-                foundCurrent = true;
-            } else {
-                step.status = "done";
-            }
+    onEvent("plan_diff", (ev) => {
+        log(`plan updated: ${ev.ops.length} change(s)`, "info");
+        ev.ops.forEach((op) => {
+            planSteps.splice(op.start, op.end - op.start, ...op.steps.map((label) => ({ label, status: "pending" })));
         });
         renderPlan();
     });
 
+    onEvent("step", (ev) => {
+        const step = planSteps[ev.index];
+        if (!step) return;
+        step.status = ev.status;
+        renderStep(ev.index);
+        if (ev.status === "active") {
+            log(`subtask ${ev.index + 1}/${planSteps.length}: ${step.label}`, "info");
+            subtaskLabel.textContent = step.label;
+        }
+    });
+
+    onEvent("mission", (ev) => {
+        log(`mission ${ev.mission} ${ev.state}`, "ok");
+        subtaskLabel.textContent = ev.state === "done" ? "Done." : ev.state;
+    });
+
     evtSource.onerror = () => {
         setStatus(false);
         log(`SSE connection lost. Retrying in 3s (attempt #${connectAttempt})`, "warn");
@@ -142,11 +172,17 @@ function send() {
     renderPlan();
     subtaskLabel.textContent = "Planning...";
 
-    fetch(`${BRIDGE_URL}/goal`, {
+    const postGoal = (base) => fetch(`${base}/goal`, {
         method: "POST",
         headers: { "Content-Type": "application/json" },
         body: JSON.stringify({ prompt: text }),
-    })
+    });
+
+    postGoal(CONTROL_URL)
+        .catch((err) => {
+            log(`Control lane unreachable (${err.message}), retrying via ${BRIDGE_URL}`, "warn");
+            return postGoal(BRIDGE_URL);
+        })
         .then((res) => {
             if (!res.ok) throw new Error(`HTTP ${res.status}`);
             log(`Goal accepted by server`, "ok");
@@ -5,18 +5,88 @@ Edge Rescue — HTTP + SSE bridge server.
 Endpoints:
   POST /goal        — accepts {"prompt": "..."}, publishes to ROS2 topic
   GET  /events      — SSE stream of plan and subtask updates
+  GET  /events?v=2  — versioned, sequence-numbered mission events
+                      (add &encoding=msgpack, or Accept: application/x-msgpack,
+                      for a compact binary stream)
   GET  /cam0/stream — MJPEG stream from /cam0/compressed ROS2 topic
   GET  /cam0/snap   — single JPEG snapshot
+  GET  /cam0/roi?x=&y=&w=&h=[&step=N][&format=jpeg|npy]
+                    — crop of the latest frame (decoded once, shared by all requests)
+  GET  /cam0/frame.npy?step=N — downsampled frame as a NumPy array
+  GET  /cam0/channels?x=&y=&w=&h= — per-channel mean/std/min/max
+  GET  /missions    — missions with a recorded keyframe timeline
+  GET  /missions/{id}/timeline     — keyframe index (one entry per subtask transition)
+  GET  /missions/{id}/timeline.jpg — sprite sheet of the keyframe thumbnails
+  GET  /stereo/snap — latest timestamp-matched left/right pair (multipart/mixed)
+  GET  /stereo/stream — stream of matched pairs (x-mixed-replace of multipart/mixed)
+  GET  /stats       — per-camera QoS, drop and latency statistics
+  GET  /debug/profile?seconds=N&hz=M
+                    — sample all thread stacks, collapsed-stack output
+                      (needs BRIDGE_DEBUG_TOKEN; send Authorization: Bearer <token>)
 
 Run:  source /opt/ros/humble/setup.bash && python3 bridge.py
+      [--qos /cam0/compressed=reliable,depth=5,deadline_ms=100]
+
+Control lane: POST /goal and CORS preflights are also served by a separate
+      listener on port 9091 (--control-port) with its own accept queue,
+      so a viewer reconnect storm on 9090 can't delay a goal. On 9090 every
+      endpoint class (stream / query / control) has its own connection cap;
+      over-cap requests get an immediate 503. The control listener has its
+      own caps, so stalled or slow goals on 9090 can't use up its slots.
+      Control ack latency vs the SLO is reported in /stats.
+
+Compression: /events (both versions) and JSON responses honour
+      Accept-Encoding: gzip / deflate. Streams keep one compressor per
+      connection, sync-flushed after every event (--compression stream), or
+      write each v2 event's deflate segment compressed once for all clients
+      (--compression shared). Ratio and CPU cost are reported in /stats.
+
+Relay:  python3 bridge.py --relay http://<robot-bridge>:9090
+      Holds one upstream connection each for /events?v=2, /cam0/stream and
+      /stereo/stream and re-serves the same endpoints locally, so viewers
+      attached to a relay cost the robot host nothing. /goal is forwarded.
+      Relays can be chained.
 """
 
+import argparse
+import collections
+import difflib
+import hmac
+import io
 import json
+import math
+import os
 import subprocess
+import sys
 import threading
 import queue
 import time
+import urllib.error
+import urllib.request
+import uuid
+import zlib
 from http.server import HTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
 
 HOST = "0.0.0.0"
 PORT = 9090
@@ -25,6 +95,14 @@ PORT = 9090
 sse_clients = []  # list of queue.Queue
 sse_lock = threading.Lock()
 
+# ---- Mission event state (protocol v2) ----
+EVENT_VERSION = 2
+STEP_STATUSES = ("pending", "active", "done", "failed")
+event_clients = []         # list of queue.Queue, each fed {encoding: bytes} frames
+event_lock = threading.RLock()
+event_seq = 0
+mission_state = None       # {"mission", "steps", "status", "state"} of the latest mission
+
 # ---- Camera state ----
 latest_frame = None        # raw JPEG bytes
 latest_frame_lock = threading.Lock()
@@ -32,6 +110,688 @@ cam_clients = []           # list of threading.Event to notify MJPEG clients
 cam_clients_lock = threading.Lock()
 cam_running = False
 
+# ---- Camera QoS ----
+# reliability: "best_effort" drops frames instead of retransmitting them over
+# lossy Wi-Fi; "reliable" is the ROS2 default. depth is the KEEP_LAST history
+# depth; deadline_ms (0 = off) flags gaps between frames longer than that.
+# A requested deadline only matches publishers that offer one at least as
+# tight, and stock camera drivers offer none, so it is opt-in via --qos.
+CAM_TOPIC = "/cam0/compressed"
+DEFAULT_CAMERA_QOS = {"reliability": "reliable", "depth": 1, "deadline_ms": 0}
+CAMERA_QOS = {
+    CAM_TOPIC: {"reliability": "best_effort", "depth": 1, "deadline_ms": 0},
+    "/cam1/compressed": {"reliability": "best_effort", "depth": 1, "deadline_ms": 0},
+}
+LATE_FRAME_MS = 200        # publisher stamp -> bridge receive latency counted as "late"
+camera_stats = {}          # topic -> FrameStats
+
+# ---- Relay mode ----
+relay_upstream = None      # base URL of the upstream bridge, set by --relay
+RELAY_BACKOFF_MAX = 10     # seconds between upstream reconnect attempts
+STREAM_KEEPALIVE = 10      # max seconds an event/camera stream stays silent before it writes a keepalive
+RELAY_TIMEOUT = 3 * STREAM_KEEPALIVE  # upstream read timeout: only a dead link is this quiet
+relay_stats = {}           # link name -> {"connected", "connects", "items", "bytes", "error"}
+relay_stats_lock = threading.Lock()
+
+# ---- Decoded frame cache ----
+ROI_JPEG_QUALITY = 85
+
+# ---- Mission timeline (keyframe per subtask) ----
+THUMB_WIDTH = 160
+SPRITE_COLUMNS = 6
+SPRITE_JPEG_QUALITY = 80
+MAX_TIMELINES = 20         # oldest missions' timelines are dropped beyond this
+timelines = collections.OrderedDict()  # mission id -> {"keyframes": [...], "sprite", "tile", "columns"}
+timeline_lock = threading.Lock()
+thumb_queue = queue.Queue()
+thumb_worker = None
+
+# ---- Stereo pair ----
+STEREO_TOPICS = ("/cam0/compressed", "/cam1/compressed")  # (left, right)
+STEREO_TOLERANCE_MS = 10   # max header-stamp skew for two frames to form a pair
+STEREO_BUFFER = 8          # frames kept per camera while waiting for a partner
+STEREO_BOUNDARY = "stereopair"
+stereo_sync = None         # StereoSync, created in main()
+stereo_clients = []        # list of threading.Event to notify stereo stream clients
+stereo_clients_lock = threading.Lock()
+
+# ---- Response compression ----
+COMPRESSION_MODE = "stream"    # "stream" | "shared" | "off", set by --compression
+COMPRESS_LEVEL = 6
+COMPRESS_MIN_BYTES = 512       # smaller JSON responses are sent as-is
+STREAM_WBITS = {"gzip": 16 + zlib.MAX_WBITS, "deflate": zlib.MAX_WBITS}
+# Headers that turn a run of raw-deflate segments into a gzip / zlib stream
+STREAM_HEADERS = {"gzip": b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff", "deflate": b"\x78\x9c"}
+compression_stats = {enc: {"streams": 0, "raw_bytes": 0, "wire_bytes": 0, "cpu_s": 0.0} for enc in STREAM_WBITS}
+shared_segment_stats = {"segments": 0, "raw_bytes": 0, "wire_bytes": 0, "cpu_s": 0.0}
+compression_lock = threading.Lock()
+compressed_event_clients = 0   # v2 clients on a compressed stream; shared segments are built only if > 0
+
+# ---- Control lane ----
+CONTROL_PORT = 9091        # dedicated /goal + OPTIONS listener (0 = disabled)
+CONTROL_SLO_MS = 50        # accept -> response-sent target for control requests
+LISTEN_BACKLOG = 1024      # main accept queue (socketserver defaults to 5; kernel caps at somaxconn)
+CONTROL_BACKLOG = 128
+LANE_CAPS = {"stream": 600, "query": 64, "control": 32}  # concurrent requests per endpoint class, per listener
+REQUEST_TIMEOUT = 5        # seconds a client may stall mid request line, headers or body
+STREAM_PATHS = ("/events", "/cam0/stream", "/stereo/stream")
+conn_state = threading.local()  # .accepted_at for the connection this thread serves
+
+# ---- Sampling profiler ----
+DEBUG_TOKEN = os.environ.get("BRIDGE_DEBUG_TOKEN", "")  # unset = /debug/* disabled
+PROFILE_MAX_SECONDS = 60
+PROFILE_DEFAULT_HZ = 100
+PROFILE_MAX_HZ = 1000
+thread_tags = {}           # thread ident -> "GET /cam0/stream", "mission", ...
+profile_lock = threading.Lock()
+
+
+class FrameStats:
+    """Drop / latency accounting for one camera topic.
+
+    ROS2 headers carry no sequence number, so drops are inferred from gaps
+    in header stamps relative to the median frame interval. Latency is
+    receive time minus header stamp and is only meaningful when publisher
+    and bridge clocks are synced (chrony/NTP across the mesh).
+    """
+
+    def __init__(self, topic, qos):
+        self.topic = topic
+        self.qos = dict(qos)
+        self.lock = threading.Lock()
+        self.received = 0
+        self.bytes = 0
+        self.dropped = 0           # inferred from stamp gaps
+        self.lost = 0              # reported by the middleware (message_lost)
+        self.deadline_missed = 0
+        self.incompatible_qos = 0   # publishers we failed to match (see the log for the policy)
+        self.late = 0
+        self.out_of_order = 0
+        self.last_stamp = None
+        self.intervals = collections.deque(maxlen=30)
+        self.latencies = collections.deque(maxlen=300)  # ms, most recent frames
+
+    def on_frame(self, stamp, size):
+        """Record a frame; stamp is the header stamp in seconds (0 if unset)."""
+        now = time.time()
+        with self.lock:
+            self.received += 1
+            self.bytes += size
+            if not stamp:
+                return
+            latency_ms = (now - stamp) * 1000
+            self.latencies.append(latency_ms)
+            if latency_ms > LATE_FRAME_MS:
+                self.late += 1
+            if self.last_stamp is not None:
+                interval = stamp - self.last_stamp
+                if interval <= 0:
+                    self.out_of_order += 1
+                    return
+                if len(self.intervals) >= 5:
+                    period = sorted(self.intervals)[len(self.intervals) // 2]
+                    if interval > 1.5 * period:
+                        self.dropped += round(interval / period) - 1
+                self.intervals.append(interval)
+            self.last_stamp = stamp
+
+    def snapshot(self):
+        with self.lock:
+            lat = sorted(self.latencies)
+            intervals = sorted(self.intervals)
+            expected = self.received + self.dropped
+            return {
+                "topic": self.topic,
+                "qos": self.qos,
+                "received": self.received,
+                "bytes": self.bytes,
+                "dropped": self.dropped,
+                "lost": self.lost,
+                "drop_rate": round(self.dropped / expected, 4) if expected else 0.0,
+                "deadline_missed": self.deadline_missed,
+                "incompatible_qos": self.incompatible_qos,
+                "late": self.late,
+                "out_of_order": self.out_of_order,
+                "fps": round(1 / intervals[len(intervals) // 2], 2) if intervals else None,
+                "latency_ms": {
+                    "p50": round(lat[len(lat) // 2], 1),
+                    "p95": round(lat[int(len(lat) * 0.95)], 1),
+                    "max": round(lat[-1], 1),
+                } if lat else None,
+            }
+
+
+def decode_jpeg(data):
+    """JPEG bytes -> uint8 array, (H, W) for mono or (H, W, 3) RGB."""
+    if cv2 is not None:
+        arr = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_UNCHANGED)
+        if arr is None:
+            raise ValueError("undecodable JPEG")
+        if arr.ndim == 3:
+            arr = cv2.cvtColor(arr, cv2.COLOR_BGR2RGB)
+        return arr
+    img = Image.open(io.BytesIO(data))
+    if img.mode not in ("L", "RGB"):
+        img = img.convert("RGB")
+    return np.asarray(img)
+
+
+def encode_jpeg(arr, quality=ROI_JPEG_QUALITY):
+    if cv2 is not None:
+        if arr.ndim == 3:
+            arr = cv2.cvtColor(np.ascontiguousarray(arr), cv2.COLOR_RGB2BGR)
+        ok, buf = cv2.imencode(".jpg", arr, [cv2.IMWRITE_JPEG_QUALITY, quality])
+        return buf.tobytes()
+    out = io.BytesIO()
+    Image.fromarray(np.ascontiguousarray(arr)).save(out, format="JPEG", quality=quality)
+    return out.getvalue()
+
+
+class DecodedFrame:
+    """Decode-once cache of the latest JPEG as a read-only NumPy array.
+
+    Decoding happens lazily on the first request for a new frame; the lock
+    makes concurrent requests for that frame wait for the one decode
+    instead of each doing their own. A frame that fails to decode is
+    remembered too, so get() returns None for it without retrying.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.source = None
+        self.array = None
+        self.decodes = 0
+        self.failures = 0
+        self.requests = 0
+
+    def get(self, jpeg):
+        with self.lock:
+            self.requests += 1
+            if jpeg is not self.source:
+                try:
+                    arr = decode_jpeg(jpeg)
+                except Exception as e:  # cv2 -> ValueError, Pillow -> UnidentifiedImageError/OSError
+                    print(f"[cam]  Frame undecodable ({len(jpeg)} bytes): {e}")
+                    self.source, self.array = jpeg, None
+                    self.failures += 1
+                    return None
+                arr.setflags(write=False)
+                self.source, self.array = jpeg, arr
+                self.decodes += 1
+            return self.array
+
+    def snapshot(self):
+        with self.lock:
+            return {"decodes": self.decodes, "failures": self.failures, "requests": self.requests,
+                    "shape": list(self.array.shape) if self.array is not None else None}
+
+
+cam0_decoded = DecodedFrame()
+
+
+def capture_keyframe(mission_id, index, label):
+    """Record the current cam0 frame for a subtask transition.
+
+    The frame is kept by reference (frames are immutable bytes, so no copy);
+    decoding and thumbnailing happen on the background thumbnail worker.
+    Without numpy and cv2/Pillow the keyframe is indexed without a frame.
+    """
+    global thumb_worker
+    with latest_frame_lock:
+        frame = latest_frame
+    if np is None or (cv2 is None and Image is None):
+        frame = None  # nothing would ever thumbnail it and release it
+    kf = {"index": index, "label": label, "t": round(time.time(), 3), "jpeg": frame, "thumb": None, "failed": False}
+    with timeline_lock:
+        tl = timelines.get(mission_id)
+        if tl is None:
+            tl = timelines[mission_id] = {"keyframes": [], "sprite": None, "tile": None, "columns": 0, "tiles": 0}
+            while len(timelines) > MAX_TIMELINES:
+                timelines.popitem(last=False)
+        tl["keyframes"].append(kf)
+        if frame is None:
+            return
+        if thumb_worker is None:
+            thumb_worker = threading.Thread(target=tagged("thumbnails", thumbnail_worker), daemon=True)
+            thumb_worker.start()
+    thumb_queue.put((mission_id, kf))
+
+
+def make_thumbnail(jpeg):
+    """Decode and downscale to THUMB_WIDTH wide, always 3-channel RGB."""
+    arr = decode_jpeg(jpeg)
+    h, w = arr.shape[:2]
+    size = (THUMB_WIDTH, max(1, round(h * THUMB_WIDTH / w)))
+    if cv2 is not None:
+        arr = cv2.resize(arr, size, interpolation=cv2.INTER_AREA)
+    else:
+        arr = np.asarray(Image.fromarray(arr).resize(size, Image.BILINEAR))
+    if arr.ndim == 2:
+        arr = np.stack([arr] * 3, axis=-1)
+    return arr
+
+
+def build_sprite(keyframes):
+    """Tile the built thumbnails row-major into one JPEG; returns (jpeg, tile (w, h), columns, tiles)."""
+    thumbs = [kf["thumb"] for kf in keyframes if kf["thumb"] is not None]
+    if not thumbs:
+        return None, None, 0, 0
+    tile_h = max(t.shape[0] for t in thumbs)
+    columns = min(SPRITE_COLUMNS, len(thumbs))
+    rows = -(-len(thumbs) // columns)
+    sheet = np.zeros((rows * tile_h, columns * THUMB_WIDTH, 3), np.uint8)
+    for n, thumb in enumerate(thumbs):
+        y, x = (n // columns) * tile_h, (n % columns) * THUMB_WIDTH
+        sheet[y:y + thumb.shape[0], x:x + thumb.shape[1]] = thumb
+    return encode_jpeg(sheet, SPRITE_JPEG_QUALITY), (THUMB_WIDTH, tile_h), columns, len(thumbs)
+
+
+def refresh_sprite(mission_id):
+    with timeline_lock:
+        tl = timelines.get(mission_id)
+        keyframes = list(tl["keyframes"]) if tl else None
+    if not keyframes:
+        return  # evicted meanwhile
+    sprite, tile, columns, tiles = build_sprite(keyframes)
+    with timeline_lock:
+        if mission_id in timelines:
+            timelines[mission_id].update(sprite=sprite, tile=tile, columns=columns, tiles=tiles)
+
+
+def thumbnail_worker():
+    """Build thumbnails off the request path and refresh each mission's sprite sheet.
+
+    Sprites are rebuilt once the queue drains, for every mission that got a
+    thumbnail since the last rebuild. Failures are logged and never end the
+    thread: a keyframe that can't be thumbnailed is marked failed and its
+    frame dropped; a sprite that fails to build is retried later.
+    """
+    dirty = set()
+    while True:
+        mission_id, kf = thumb_queue.get()
+        try:
+            try:
+                thumb = make_thumbnail(kf["jpeg"])
+            except Exception as e:
+                print(f"[timeline] thumbnail failed for {mission_id}: {e}")
+                thumb = None
+            with timeline_lock:
+                kf["thumb"], kf["jpeg"] = thumb, None  # full frame no longer needed
+                kf["failed"] = thumb is None
+            dirty.add(mission_id)
+            if not thumb_queue.empty():
+                continue  # rebuild once the queued thumbnails are done
+            for dirty_id in list(dirty):
+                try:
+                    refresh_sprite(dirty_id)
+                except Exception as e:
+                    print(f"[timeline] sprite rebuild failed for {dirty_id}: {e}")
+                    continue  # stays dirty, retried after the next thumbnail
+                dirty.discard(dirty_id)
+        except Exception as e:
+            print(f"[timeline] worker error: {e}")
+
+
+def timeline_index(mission_id):
+    """JSON index for a mission's timeline: keyframes and their tile in the sprite."""
+    with timeline_lock:
+        tl = timelines.get(mission_id)
+        if tl is None:
+            return None
+        entries = []
+        tile_no = 0
+        for kf in tl["keyframes"]:
+            entry = {"index": kf["index"], "label": kf["label"], "t": kf["t"], "tile": None, "failed": kf["failed"]}
+            if kf["thumb"] is not None:
+                if tile_no < tl["tiles"]:
+                    entry["tile"] = {"x": (tile_no % tl["columns"]) * tl["tile"][0],
+                                     "y": (tile_no // tl["columns"]) * tl["tile"][1]}
+                tile_no += 1
+            entries.append(entry)
+        pending = sum(1 for kf in tl["keyframes"] if kf["jpeg"] is not None)
+        return {
+            "mission": mission_id,
+            "sprite": f"/missions/{mission_id}/timeline.jpg" if tl["sprite"] else None,
+            "tile": {"w": tl["tile"][0], "h": tl["tile"][1]} if tl["tile"] else None,
+            "columns": tl["columns"],
+            "pending": pending,
+            "keyframes": entries,
+        }
+
+
+class StereoSync:
+    """Pairs frames from two cameras whose header stamps are within a tolerance.
+
+    Each camera keeps a small ring buffer. When a frame arrives it is matched
+    against the closest-stamped frame in the other camera's buffer; a match
+    becomes the latest pair and everything at or before it is discarded, so
+    pairs are always monotonic in time. The multipart body for a pair is
+    built once and shared by every client.
+    """
+
+    def __init__(self, tolerance_ms=STEREO_TOLERANCE_MS, buffer=STEREO_BUFFER):
+        self.tolerance = tolerance_ms / 1000
+        self.buffers = (collections.deque(maxlen=buffer), collections.deque(maxlen=buffer))
+        self.lock = threading.Lock()
+        self.latest = None         # {"seq", "stamps", "skew_ms", "body"}
+        self.pairs = 0
+        self.unmatched = 0
+
+    def push(self, side, stamp, data):
+        """Add a frame from side 0 (left) or 1 (right); returns True if it completed a pair."""
+        with self.lock:
+            own, other = self.buffers[side], self.buffers[1 - side]
+            if len(own) == own.maxlen:
+                self.unmatched += 1
+            own.append((stamp, data))
+            match = min(other, key=lambda f: abs(f[0] - stamp), default=None)
+            if match is None or abs(match[0] - stamp) > self.tolerance:
+                return False
+
+            for buf, cutoff in ((own, stamp), (other, match[0])):
+                while buf and buf[0][0] <= cutoff:
+                    buf.popleft()
+                    self.unmatched += 1
+            self.unmatched -= 2  # the matched frames themselves
+
+            left, right = ((stamp, data), match) if side == 0 else (match, (stamp, data))
+        self.publish(build_stereo_body(left, right), round((right[0] - left[0]) * 1000, 3))
+        return True
+
+    def publish(self, body, skew_ms):
+        """Make a ready-built pair body the latest pair (also used by relay mode)."""
+        with self.lock:
+            self.pairs += 1
+            self.latest = {"seq": self.pairs, "skew_ms": skew_ms, "body": body}
+        with stereo_clients_lock:
+            for evt in stereo_clients:
+                evt.set()
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                "tolerance_ms": self.tolerance * 1000,
+                "pairs": self.pairs,
+                "unmatched": self.unmatched,
+                "last_skew_ms": self.latest["skew_ms"] if self.latest else None,
+            }
+
+
+def build_stereo_body(left, right):
+    """multipart/mixed body with the left then right JPEG, each tagged with its stamp."""
+    parts = []
+    for name, (stamp, data) in (("left", left), ("right", right)):
+        parts.append(
+            f"--{STEREO_BOUNDARY}\r\n"
+            f"Content-Type: image/jpeg\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            f"X-Camera: {name}\r\n"
+            f"X-Timestamp: {stamp:.6f}\r\n\r\n".encode()
+        )
+        parts.append(data)
+        parts.append(b"\r\n")
+    parts.append(f"--{STEREO_BOUNDARY}--\r\n".encode())
+    return b"".join(parts)
+
+
+def publish_cam_frame(frame_bytes):
+    """Make frame_bytes the latest cam0 frame and wake MJPEG clients."""
+    global latest_frame
+    with latest_frame_lock:
+        latest_frame = frame_bytes
+    with cam_clients_lock:
+        for evt in cam_clients:
+            evt.set()
+
+
+def parse_qos_override(spec):
+    """Parse "TOPIC=reliability[,depth=N][,deadline_ms=N]" into (topic, qos dict)."""
+    topic, _, opts = spec.partition("=")
+    qos = dict(CAMERA_QOS.get(topic, DEFAULT_CAMERA_QOS))
+    for opt in filter(None, opts.split(",")):
+        key, _, value = opt.partition("=")
+        if not value:
+            qos["reliability"] = key
+        elif key in ("depth", "deadline_ms"):
+            qos[key] = int(value)
+        else:
+            raise ValueError(f"unknown QoS option: {key}")
+    if qos["depth"] < 1:
+        raise ValueError(f"depth must be at least 1: {qos['depth']}")
+    if qos["deadline_ms"] < 0:
+        raise ValueError(f"deadline_ms must be 0 (off) or positive: {qos['deadline_ms']}")
+    if qos["reliability"] not in ("reliable", "best_effort"):
+        raise ValueError(f"unknown reliability: {qos['reliability']}")
+    return topic, qos
+
+
+def deflate_segment(data):
+    """Raw deflate of `data`, sync-flushed so it can be spliced into any gzip/zlib stream."""
+    z = zlib.compressobj(COMPRESS_LEVEL, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return z.compress(data) + z.flush(zlib.Z_SYNC_FLUSH)
+
+
+def record_compression(encoding, raw=0, wire=0, cpu=0.0, streams=0):
+    with compression_lock:
+        st = compression_stats[encoding]
+        st["raw_bytes"] += raw
+        st["wire_bytes"] += wire
+        st["cpu_s"] += cpu
+        st["streams"] += streams
+
+
+def compression_snapshot():
+    """Per-encoding totals plus ratio and CPU microseconds per KiB of input.
+
+    In shared mode the per-client entries carry no CPU (segments are reused);
+    the one-off cost of building them is under "shared_segments".
+    """
+    def summarize(st):
+        return dict(st, ratio=round(st["raw_bytes"] / st["wire_bytes"], 2) if st["wire_bytes"] else None,
+                    cpu_us_per_kb=round(st["cpu_s"] * 1e6 / (st["raw_bytes"] / 1024), 1) if st["raw_bytes"] else None)
+
+    with compression_lock:
+        out = {enc: summarize(st) for enc, st in compression_stats.items()}
+        out["shared_segments"] = summarize(shared_segment_stats)
+    return out
+
+
+class StreamEncoder:
+    """Content-Encoding for one long-lived response (SSE / msgpack event stream).
+
+    Per-connection mode keeps one compressor for the whole response and
+    sync-flushes it after each event, so every event goes out immediately
+    but is still compressed against everything sent before it. Shared mode
+    instead writes segments that were compressed once per event for all
+    clients (see encode_event), behind this connection's gzip/zlib header.
+    Streams end when the client goes away, so no trailer is ever written.
+    """
+
+    def __init__(self, encoding, shared=False):
+        self.encoding = encoding
+        self.shared = shared
+        self.started = False
+        if encoding != "identity":
+            record_compression(encoding, streams=1)
+            if not shared:
+                self.z = zlib.compressobj(COMPRESS_LEVEL, zlib.DEFLATED, STREAM_WBITS[encoding])
+
+    def encode(self, data, segment=None):
+        """Bytes to write for one event; `segment` is its shared deflate segment, if any."""
+        if self.encoding == "identity":
+            return data
+        t0 = time.thread_time()
+        if self.shared:
+            out = segment if segment is not None else deflate_segment(data)
+            if not self.started:
+                out = STREAM_HEADERS[self.encoding] + out
+            cpu = 0.0 if segment is not None else time.thread_time() - t0
+        else:
+            out = self.z.compress(data) + self.z.flush(zlib.Z_SYNC_FLUSH)
+            cpu = time.thread_time() - t0
+        self.started = True
+        record_compression(self.encoding, raw=len(data), wire=len(out), cpu=cpu)
+        return out
+
+
+def negotiate_encoding(accept_encoding):
+    """Pick gzip, then deflate, from an Accept-Encoding header; "identity" otherwise."""
+    if COMPRESSION_MODE == "off":
+        return "identity"
+    offered = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        offered[name.strip().lower()] = q
+    for enc in ("gzip", "deflate"):
+        if offered.get(enc, offered.get("*", 0)) > 0:
+            return enc
+    return "identity"
+
+
+class Lane:
+    """Concurrency cap and ack-latency tracking for one class of endpoints."""
+
+    def __init__(self, name, cap, slo_ms=None):
+        self.name = name
+        self.cap = cap
+        self.slo_ms = slo_ms
+        self.lock = threading.Lock()
+        self.active = 0
+        self.served = 0
+        self.rejected = 0
+        self.slo_missed = 0
+        self.latencies = collections.deque(maxlen=1000)  # ms, accept -> handler done
+
+    def enter(self):
+        with self.lock:
+            if self.active >= self.cap:
+                self.rejected += 1
+                return False
+            self.active += 1
+            return True
+
+    def leave(self, latency_ms=None):
+        with self.lock:
+            self.active -= 1
+            self.served += 1
+            if latency_ms is not None:
+                self.latencies.append(latency_ms)
+                if self.slo_ms is not None and latency_ms > self.slo_ms:
+                    self.slo_missed += 1
+
+    def snapshot(self):
+        with self.lock:
+            lat = sorted(self.latencies)
+            return {
+                "cap": self.cap,
+                "active": self.active,
+                "served": self.served,
+                "rejected": self.rejected,
+                "slo_ms": self.slo_ms,
+                "slo_missed": self.slo_missed,
+                "latency_ms": {
+                    "p50": round(lat[len(lat) // 2], 2),
+                    "p99": round(lat[int(len(lat) * 0.99)], 2),
+                    "max": round(lat[-1], 2),
+                } if lat else None,
+            }
+
+
+def make_lanes():
+    return {name: Lane(name, cap, CONTROL_SLO_MS if name == "control" else None)
+            for name, cap in LANE_CAPS.items()}
+
+
+lanes = make_lanes()          # main listener
+control_lanes = make_lanes()  # control listener, so 9090 traffic can't fill its slots
+
+
+def lane_for(command, path):
+    if command == "OPTIONS" or (command == "POST" and path == "/goal"):
+        return "control"
+    if command == "GET" and path in STREAM_PATHS:
+        return "stream"
+    return "query"
+
+
+def tagged(tag, target):
+    """Wrap a thread target so profiler samples from that thread are labelled `tag`."""
+    def run(*args):
+        thread_tags[threading.get_ident()] = tag
+        try:
+            target(*args)
+        finally:
+            thread_tags.pop(threading.get_ident(), None)
+    return run
+
+
+def sample_stacks(seconds, hz):
+    """Sample every thread's stack at `hz` for `seconds`.
+
+    Returns (samples, busy_seconds, collapsed) where collapsed is one
+    "tag;outer;...;leaf count" line per distinct stack, ready for
+    flamegraph.pl or speedscope. Frames are labelled per function (not per
+    line) and labels are cached per code object to keep each tick cheap.
+    """
+    me = threading.get_ident()
+    labels = {}
+    names = {}
+    counts = collections.Counter()
+    interval = 1.0 / hz
+    start = time.perf_counter()
+    deadline = start + seconds
+    next_tick = start
+    samples = 0
+    busy = 0.0
+    while next_tick < deadline:
+        t0 = time.perf_counter()
+        for ident, frame in sys._current_frames().items():
+            if ident == me:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                label = labels.get(code)
+                if label is None:
+                    label = labels[code] = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+                stack.append(label)
+                frame = frame.f_back
+            tag = thread_tags.get(ident)
+            if tag is None:
+                if ident not in names:
+                    names = {t.ident: t.name for t in threading.enumerate()}
+                tag = names.get(ident, f"thread-{ident}")
+            stack.append(tag)
+            counts[tuple(stack)] += 1
+        samples += 1
+        busy += time.perf_counter() - t0
+        next_tick += interval
+        delay = next_tick - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        else:
+            next_tick = time.perf_counter()  # fell behind: skip ticks rather than burst
+    collapsed = "\n".join(";".join(reversed(stack)) + f" {n}" for stack, n in counts.most_common())
+    return samples, busy, collapsed + "\n"
+
+
+def drop_client(q):
+    """Hang up a client whose queue overflowed.
+
+    Its backlog is replaced by a None sentinel so the handler closes the
+    connection; the client reconnects and gets a fresh snapshot instead of
+    silently missing events behind keepalives.
+    """
+    with q.mutex:
+        q.queue.clear()
+    q.put(None, block=False)
+
 
 def broadcast_sse(event_type, data):
     """Push an SSE event to all connected clients."""
@@ -44,6 +804,113 @@ def broadcast_sse(event_type, data):
                 dead.append(q)
         for q in dead:
             sse_clients.remove(q)
+            drop_client(q)
+
+
+def encode_event(event):
+    """Serialize an event once per wire encoding: SSE text and (optionally) MessagePack."""
+    frames = {
+        "json": f"id: {event['seq']}\nevent: {event['type']}\ndata: {json.dumps(event)}\n\n".encode(),
+    }
+    if msgpack is not None:
+        frames["msgpack"] = msgpack.packb(event)
+    if COMPRESSION_MODE == "shared" and compressed_event_clients:
+        # One deflate per wire format, reused by every gzip and deflate client
+        t0 = time.thread_time()
+        for fmt in list(frames):
+            frames[fmt + ".z"] = deflate_segment(frames[fmt])
+        with compression_lock:
+            shared_segment_stats["cpu_s"] += time.thread_time() - t0
+            for fmt in list(frames):
+                if not fmt.endswith(".z"):
+                    shared_segment_stats["segments"] += 1
+                    shared_segment_stats["raw_bytes"] += len(frames[fmt])
+                    shared_segment_stats["wire_bytes"] += len(frames[fmt + ".z"])
+    return frames
+
+
+def broadcast_event(event_type, **fields):
+    """Push a versioned, sequence-numbered event to all v2 clients.
+
+    Every event carries {"v", "seq", "type"}; mission events add "mission"
+    and, for step updates, "index" and "status" so clients update one step
+    in O(1) instead of matching labels against the whole plan.
+    """
+    global event_seq
+    with event_lock:
+        event_seq += 1
+        frames = encode_event({"v": EVENT_VERSION, "seq": event_seq, "type": event_type, **fields})
+        dead = []
+        for q in event_clients:
+            try:
+                q.put(frames, block=False)
+            except queue.Full:
+                dead.append(q)
+        for q in dead:
+            event_clients.remove(q)
+            drop_client(q)
+
+
+def mission_snapshot():
+    """Full "plan" event describing the latest mission, sent to clients as they join."""
+    if mission_state is None:
+        return None
+    return encode_event({
+        "v": EVENT_VERSION, "seq": event_seq, "type": "plan",
+        "mission": mission_state["mission"], "steps": mission_state["steps"],
+        "status": mission_state["status"], "state": mission_state["state"],
+    })
+
+
+def publish_plan(mission_id, steps):
+    """Announce a mission's plan. Re-planning the same mission sends only a plan_diff."""
+    global mission_state
+    steps = list(steps)
+    broadcast_sse("plan", json.dumps(steps))
+    with event_lock:
+        if mission_state is None or mission_state["mission"] != mission_id:
+            mission_state = {"mission": mission_id, "steps": steps,
+                             "status": ["pending"] * len(steps), "state": "running"}
+            broadcast_event("plan", mission=mission_id, steps=steps,
+                            status=mission_state["status"], state="running")
+            return
+
+        # Splices against the old plan, last first, so clients can apply them in order
+        old = mission_state["steps"]
+        ops = []
+        for tag, i1, i2, j1, j2 in reversed(difflib.SequenceMatcher(None, old, steps).get_opcodes()):
+            if tag == "equal":
+                continue
+            ops.append({"start": i1, "end": i2, "steps": steps[j1:j2]})
+            mission_state["status"][i1:i2] = ["pending"] * (j2 - j1)
+        mission_state["steps"] = steps
+        if ops:
+            broadcast_event("plan_diff", mission=mission_id, ops=ops)
+
+
+def set_step_status(mission_id, index, status):
+    """Update one plan step ("pending", "active", "done" or "failed")."""
+    if status not in STEP_STATUSES:
+        raise ValueError(f"unknown step status: {status}")
+    with event_lock:
+        if mission_state is None or mission_state["mission"] != mission_id:
+            return
+        mission_state["status"][index] = status
+        broadcast_event("step", mission=mission_id, index=index, status=status)
+        label = mission_state["steps"][index]
+    if status == "active":
+        broadcast_sse("subtask", label)
+        capture_keyframe(mission_id, index, label)
+
+
+def finish_mission(mission_id, state="done"):
+    with event_lock:
+        if mission_state is None or mission_state["mission"] != mission_id:
+            return
+        mission_state["state"] = state
+        broadcast_event("mission", mission=mission_id, state=state)
+    broadcast_sse("subtask", "Done.")
+    capture_keyframe(mission_id, None, state)
 
 
 def ros2_pub(topic, message):
@@ -70,6 +937,7 @@ def handle_goal(prompt):
     print(f"  MISSION GOAL: {prompt}")
     print(f"{'='*50}\n")
 
+    mission_id = uuid.uuid4().hex[:12]
     ros2_pub("/mission/goal", prompt)
 
     # --- PLACEHOLDER: replace with actual LLM call ---
@@ -81,26 +949,30 @@ def handle_goal(prompt):
         "Report result",
     ]
 
-    broadcast_sse("plan", json.dumps(plan))
+    publish_plan(mission_id, plan)
 
     for i, step in enumerate(plan):
-        broadcast_sse("subtask", step)
+        set_step_status(mission_id, i, "active")
         print(f"  [{i+1}/{len(plan)}] {step}")
         time.sleep(1)
+        set_step_status(mission_id, i, "done")
 
-    broadcast_sse("subtask", "Done.")
+    finish_mission(mission_id)
     print("  Mission complete.\n")
 
 
 # ---- Camera subscriber (rclpy) ----
 
 def start_cam_subscriber():
-    """Background thread: subscribe to /cam0/compressed via rclpy and store frames."""
+    """Background thread: subscribe to the camera topics via rclpy and store frames."""
     global latest_frame, cam_running
 
     try:
         import rclpy
         from rclpy.node import Node
+        from rclpy.duration import Duration
+        from rclpy.qos import HistoryPolicy, QoSProfile, ReliabilityPolicy
+        from rclpy.qos_event import SubscriptionEventCallbacks
         from sensor_msgs.msg import CompressedImage
     except ImportError:
         print("[cam]  rclpy not available — camera feed disabled")
@@ -109,32 +981,75 @@ def start_cam_subscriber():
 
     rclpy.init()
 
+    def make_qos(cfg):
+        qos = QoSProfile(
+            history=HistoryPolicy.KEEP_LAST,
+            depth=cfg["depth"],
+            reliability=(ReliabilityPolicy.BEST_EFFORT if cfg["reliability"] == "best_effort"
+                         else ReliabilityPolicy.RELIABLE),
+        )
+        if cfg["deadline_ms"]:
+            qos.deadline = Duration(nanoseconds=cfg["deadline_ms"] * 1_000_000)
+        return qos
+
     class CamSub(Node):
-        def __init__(self):
+        def __init__(self, topics):
             super().__init__("bridge_cam_sub")
-            self.sub = self.create_subscription(
-                CompressedImage, "/cam0/compressed", self.on_frame, 1
-            )
-            self.frame_count = 0
+            self.subs = []
+            for topic in topics:
+                cfg = CAMERA_QOS.get(topic, DEFAULT_CAMERA_QOS)
+                stats = camera_stats[topic] = FrameStats(topic, cfg)
+                on_deadline = lambda _, st=stats: self._count(st, "deadline_missed")
+                on_incompatible = lambda info, st=stats: self._incompatible(st, info)
+                try:
+                    callbacks = SubscriptionEventCallbacks(
+                        deadline=on_deadline,
+                        incompatible_qos=on_incompatible,
+                        message_lost=lambda info, st=stats: self._count(st, "lost", info.total_count_change),
+                    )
+                except TypeError:  # message_lost events need a newer rclpy
+                    callbacks = SubscriptionEventCallbacks(deadline=on_deadline, incompatible_qos=on_incompatible)
+                self.subs.append(self.create_subscription(
+                    CompressedImage, topic, lambda msg, t=topic: self.on_frame(t, msg),
+                    make_qos(cfg), event_callbacks=callbacks,
+                ))
+                print(f"[cam]  {topic} QoS: {cfg['reliability']}, depth {cfg['depth']}, "
+                      f"deadline {cfg['deadline_ms'] or 'off'} ms")
+
+        def _count(self, stats, field, n=1):
+            with stats.lock:
+                setattr(stats, field, getattr(stats, field) + n)
 
-        def on_frame(self, msg):
-            global latest_frame
+        def _incompatible(self, stats, info):
+            self._count(stats, "incompatible_qos", info.total_count_change)
+            print(f"[cam]  {stats.topic}: publisher QoS incompatible with ours "
+                  f"(policy {info.last_policy_kind}, {info.total_count} total) — no frames from it; "
+                  f"check --qos {stats.topic}=...")
+
+        def on_frame(self, topic, msg):
             frame_bytes = bytes(msg.data)
-            with latest_frame_lock:
-                latest_frame = frame_bytes
-            # Notify all MJPEG clients
-            with cam_clients_lock:
-                for evt in cam_clients:
-                    evt.set()
-            self.frame_count += 1
-            if self.frame_count == 1:
-                print(f"[cam]  First frame received ({len(frame_bytes)} bytes, format: {msg.format})")
-            elif self.frame_count % 300 == 0:
-                print(f"[cam]  {self.frame_count} frames received")
-
-    node = CamSub()
+            stamp = msg.header.stamp.sec + msg.header.stamp.nanosec * 1e-9
+            stats = camera_stats[topic]
+            stats.on_frame(stamp, len(frame_bytes))
+            if topic == CAM_TOPIC:
+                publish_cam_frame(frame_bytes)
+            if stereo_sync is not None and topic in STEREO_TOPICS:
+                # Unstamped publishers fall back to receive time
+                stereo_sync.push(STEREO_TOPICS.index(topic), stamp or time.time(), frame_bytes)
+
+            count = stats.received
+            if count == 1:
+                print(f"[cam]  {topic}: first frame received ({len(frame_bytes)} bytes, format: {msg.format})")
+            elif count % 300 == 0:
+                st = stats.snapshot()
+                lat = st["latency_ms"] or {}
+                print(f"[cam]  {topic}: {count} frames received, {st['dropped']} dropped, "
+                      f"{st['late']} late, latency p50 {lat.get('p50')} / p95 {lat.get('p95')} ms")
+
+    topics = list(dict.fromkeys([CAM_TOPIC, *(STEREO_TOPICS if stereo_sync else ())]))
+    node = CamSub(topics)
     cam_running = True
-    print("[cam]  Subscribed to /cam0/compressed")
+    print(f"[cam]  Subscribed to {', '.join(topics)}")
 
     try:
         rclpy.spin(node)
@@ -146,23 +1061,233 @@ def start_cam_subscriber():
         rclpy.shutdown()
 
 
+# ---- Relay mode (upstream links) ----
+
+def _relay_update(link, **fields):
+    with relay_stats_lock:
+        st = relay_stats.setdefault(link, {"connected": False, "connects": 0, "items": 0, "bytes": 0, "error": None})
+        for key, value in fields.items():
+            st[key] = st[key] + value if key in ("connects", "items", "bytes") else value
+
+
+def relay_link(link, path, consume):
+    """Keep one upstream connection to `path` open forever, reconnecting with backoff.
+
+    `consume(resp)` reads the response until it ends or raises.
+    """
+    req = urllib.request.Request(relay_upstream + path, headers={"Accept-Encoding": "gzip"})
+    url = req.full_url
+    backoff = 1
+    while True:
+        try:
+            with urllib.request.urlopen(req, timeout=RELAY_TIMEOUT) as resp:
+                print(f"[relay] {link}: connected to {url}")
+                _relay_update(link, connected=True, connects=1, error=None)
+                backoff = 1
+                consume(resp)
+            _relay_update(link, connected=False, error="upstream closed")
+        except Exception as e:  # network, HTTP framing, zlib, or an event we can't apply: all mean reconnect
+            error = f"{type(e).__name__}: {e}"
+            _relay_update(link, connected=False, error=error)
+            print(f"[relay] {link}: {error} — retrying in {backoff}s")
+        time.sleep(backoff)
+        backoff = min(backoff * 2, RELAY_BACKOFF_MAX)
+
+
+def read_multipart(resp):
+    """Yield (headers, body) for each part of an upstream multipart stream.
+
+    Parts are framed by Content-Length, which every bridge stream sends.
+    """
+    while True:
+        line = resp.readline()
+        if not line:
+            return
+        if not line.startswith(b"--"):
+            continue
+        headers = {}
+        while True:
+            line = resp.readline()
+            if not line:
+                return
+            if line in (b"\r\n", b"\n"):
+                break
+            key, _, value = line.decode("latin-1").partition(":")
+            headers[key.strip().lower()] = value.strip()
+        if "content-length" not in headers:
+            continue
+        body = resp.read(int(headers["content-length"]))
+        yield headers, body
+
+
+def iter_lines(resp):
+    """Lines of an upstream stream, inflating it first if the upstream compressed it."""
+    encoding = resp.headers.get("Content-Encoding", "identity")
+    if encoding not in STREAM_WBITS:
+        for raw in resp:
+            _relay_update("events", bytes=len(raw))
+            yield raw
+        return
+    z = zlib.decompressobj(STREAM_WBITS[encoding])
+    pending = b""
+    while True:
+        chunk = resp.read1(65536)
+        if not chunk:
+            return
+        _relay_update("events", bytes=len(chunk))
+        pending += z.decompress(chunk)
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            yield line + b"\n"
+
+
+def relay_events(resp):
+    """Mirror upstream v2 events into local state; local clients get our own fan-out."""
+    data = []
+    for raw in iter_lines(resp):
+        line = raw.decode("utf-8").rstrip("\r\n")
+        if line.startswith("data:"):
+            data.append(line[5:].lstrip())
+        elif not line and data:
+            event = json.loads("\n".join(data))
+            data = []
+            _relay_update("events", items=1)
+            apply_upstream_event(event)
+
+
+def apply_upstream_event(ev):
+    """Replay one upstream v2 event through the local publish_* helpers."""
+    mission = ev.get("mission")
+    kind = ev.get("type")
+    if kind == "plan":
+        with event_lock:
+            same = mission_state is not None and mission_state["mission"] == mission
+            if not same or mission_state["steps"] != ev["steps"]:
+                publish_plan(mission, ev["steps"])
+            local_status = list(mission_state["status"])
+            local_state = mission_state["state"]
+        # A plan event is also the snapshot sent on (re)connect: catch up on statuses
+        for i, status in enumerate(ev["status"]):
+            if i < len(local_status) and local_status[i] != status:
+                set_step_status(mission, i, status)
+        if ev.get("state", "running") != local_state:
+            finish_mission(mission, ev["state"])
+    elif kind == "plan_diff":
+        with event_lock:
+            if mission_state is None or mission_state["mission"] != mission:
+                return
+            steps = list(mission_state["steps"])
+        for op in ev["ops"]:
+            steps[op["start"]:op["end"]] = op["steps"]
+        publish_plan(mission, steps)
+    elif kind == "step":
+        set_step_status(mission, ev["index"], ev["status"])
+    elif kind == "mission":
+        finish_mission(mission, ev["state"])
+
+
+def relay_cam(resp):
+    for headers, body in read_multipart(resp):
+        if "x-keepalive" in headers:
+            continue  # repeat of a frame we already have: just proves the link is alive
+        _relay_update("cam0", items=1, bytes=len(body))
+        publish_cam_frame(body)
+
+
+def relay_stereo(resp):
+    for headers, body in read_multipart(resp):
+        if "x-keepalive" in headers:
+            continue
+        _relay_update("stereo", items=1, bytes=len(body))
+        stereo_sync.publish(body, float(headers.get("x-stereo-skew-ms", "nan")))
+
+
+def start_relay():
+    links = [("events", f"/events?v={EVENT_VERSION}", relay_events), ("cam0", "/cam0/stream", relay_cam)]
+    if stereo_sync is not None:
+        links.append(("stereo", "/stereo/stream", relay_stereo))
+    for link, path, consume in links:
+        threading.Thread(target=tagged(f"relay {link}", relay_link), args=(link, path, consume), daemon=True).start()
+
+
+def forward_goal(body):
+    """POST a goal to the upstream bridge; returns (status, response body)."""
+    req = urllib.request.Request(relay_upstream + "/goal", data=body,
+                                 headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(req, timeout=10) as resp:
+            return resp.status, resp.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read()
+    except (urllib.error.URLError, OSError) as e:
+        return 502, json.dumps({"error": f"upstream unreachable: {e}"}).encode()
+
+
 class BridgeHandler(BaseHTTPRequestHandler):
     """Handles POST /goal, GET /events, GET /cam0/stream, GET /cam0/snap."""
+    timeout = REQUEST_TIMEOUT  # socket timeout while reading; lifted for streams in _in_lane
 
     def _cors_headers(self):
         self.send_header("Access-Control-Allow-Origin", "*")
         self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
-        self.send_header("Access-Control-Allow-Headers", "Content-Type")
+        self.send_header("Access-Control-Allow-Headers", "Content-Type, Authorization")
 
     def do_OPTIONS(self):
+        self._in_lane(self._options)
+
+    def do_POST(self):
+        self._in_lane(self._post)
+
+    def do_GET(self):
+        self._in_lane(self._get)
+
+    def _in_lane(self, handler):
+        """Run handler under its endpoint class's connection cap, recording ack latency."""
+        lane = self.server.lanes[lane_for(self.command, urlsplit(self.path).path)]
+        if lane.name == "stream":
+            # Streams write at the viewer's pace; dead peers are found by keepalive writes
+            self.connection.settimeout(None)
+        if not lane.enter():
+            self.send_response(503)
+            self._cors_headers()
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Retry-After", "1")
+            self.end_headers()
+            self.wfile.write(json.dumps({"error": f"{lane.name} lane full"}).encode())
+            return
+        try:
+            handler()
+        finally:
+            accepted_at = getattr(conn_state, "accepted_at", None)
+            long_lived = lane.name == "stream" or accepted_at is None
+            lane.leave(None if long_lived else (time.monotonic() - accepted_at) * 1000)
+            conn_state.accepted_at = None  # keep-alive follow-ups have no accept time
+
+    def _options(self):
         self.send_response(204)
         self._cors_headers()
         self.end_headers()
 
-    def do_POST(self):
+    def _post(self):
         if self.path == "/goal":
             length = int(self.headers.get("Content-Length", 0))
-            body = self.rfile.read(length)
+            try:
+                body = self.rfile.read(length)
+            except TimeoutError:
+                self.close_connection = True
+                self.send_response(408)
+                self._cors_headers()
+                self.end_headers()
+                self.wfile.write(b'{"error":"request body timed out"}')
+                return
+            if relay_upstream:
+                status, reply = forward_goal(body)
+                self.send_response(status)
+                self._cors_headers()
+                self.send_header("Content-Type", "application/json")
+                self.end_headers()
+                self.wfile.write(reply)
+                return
             try:
                 data = json.loads(body)
                 prompt = data.get("prompt", "")
@@ -182,20 +1307,49 @@ class BridgeHandler(BaseHTTPRequestHandler):
             self.end_headers()
             self.wfile.write(json.dumps({"status": "ok"}).encode())
 
-            threading.Thread(target=handle_goal, args=(prompt,), daemon=True).start()
+            threading.Thread(target=tagged("mission", handle_goal), args=(prompt,), daemon=True).start()
         else:
             self.send_response(404)
             self._cors_headers()
             self.end_headers()
 
-    def do_GET(self):
-        if self.path == "/events":
-            self._handle_sse()
-        elif self.path == "/cam0/stream":
+    def _get(self):
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        if url.path == "/events":
+            if query.get("v", ["1"])[0] == str(EVENT_VERSION):
+                self._handle_events_v2(self._event_encoding(query))
+            else:
+                self._handle_sse()
+        elif url.path == "/cam0/stream":
             self._handle_mjpeg()
-        elif self.path == "/cam0/snap":
+        elif url.path == "/cam0/snap":
             self._handle_snapshot()
-        elif self.path == "/":
+        elif url.path in ("/cam0/roi", "/cam0/frame.npy", "/cam0/channels"):
+            self._handle_array(url.path, query)
+        elif url.path == "/missions":
+            with timeline_lock:
+                missions = [{"mission": m, "keyframes": len(tl["keyframes"])} for m, tl in timelines.items()]
+            self._send_json({"missions": missions})
+        elif url.path.startswith("/missions/"):
+            self._handle_timeline(url.path)
+        elif url.path == "/stereo/snap":
+            self._handle_stereo_snapshot()
+        elif url.path == "/stereo/stream":
+            self._handle_stereo_stream()
+        elif url.path == "/stats":
+            self._send_json({
+                "cameras": {t: st.snapshot() for t, st in list(camera_stats.items())},
+                "stereo": stereo_sync.snapshot() if stereo_sync else None,
+                "decoded": cam0_decoded.snapshot(),
+                "relay": {"upstream": relay_upstream, "links": relay_stats} if relay_upstream else None,
+                "compression": dict(compression_snapshot(), mode=COMPRESSION_MODE),
+                "lanes": {name: lane.snapshot() for name, lane in lanes.items()},
+                "control_lanes": {name: lane.snapshot() for name, lane in control_lanes.items()},
+            })
+        elif url.path == "/debug/profile":
+            self._handle_profile(query)
+        elif url.path == "/":
             self.send_response(200)
             self._cors_headers()
             self.send_header("Content-Type", "text/plain")
@@ -206,12 +1360,21 @@ class BridgeHandler(BaseHTTPRequestHandler):
             self._cors_headers()
             self.end_headers()
 
+    def _stream_encoder(self, shared=False):
+        """Negotiate Content-Encoding for a stream; call before end_headers()."""
+        encoding = negotiate_encoding(self.headers.get("Accept-Encoding", ""))
+        if encoding != "identity":
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Vary", "Accept-Encoding")
+        return StreamEncoder(encoding, shared=shared)
+
     def _handle_sse(self):
         self.send_response(200)
         self._cors_headers()
         self.send_header("Content-Type", "text/event-stream")
         self.send_header("Cache-Control", "no-cache")
         self.send_header("Connection", "keep-alive")
+        enc = self._stream_encoder()
         self.end_headers()
 
         q = queue.Queue(maxsize=256)
@@ -223,21 +1386,253 @@ class BridgeHandler(BaseHTTPRequestHandler):
         try:
             while True:
                 try:
-                    event_type, data = q.get(timeout=15)
+                    item = q.get(timeout=STREAM_KEEPALIVE)
+                    if item is None:
+                        print(f"[sse]  Client fell behind, closing so it reconnects")
+                        break
+                    event_type, data = item
                     payload = f"event: {event_type}\ndata: {data}\n\n"
-                    self.wfile.write(payload.encode())
+                    self.wfile.write(enc.encode(payload.encode()))
                     self.wfile.flush()
                 except queue.Empty:
-                    self.wfile.write(b": keepalive\n\n")
+                    self.wfile.write(enc.encode(b": keepalive\n\n"))
                     self.wfile.flush()
         except (BrokenPipeError, ConnectionResetError, OSError):
             pass
         finally:
+            self.close_connection = True  # streamed without a length: end of body is end of connection
             with sse_lock:
                 if q in sse_clients:
                     sse_clients.remove(q)
             print(f"[sse]  Client disconnected ({len(sse_clients)} total)")
 
+    def _send_json(self, obj, status=200):
+        body = json.dumps(obj).encode()
+        encoding = negotiate_encoding(self.headers.get("Accept-Encoding", ""))
+        self.send_response(status)
+        self._cors_headers()
+        self.send_header("Content-Type", "application/json")
+        if encoding != "identity" and len(body) >= COMPRESS_MIN_BYTES:
+            t0 = time.thread_time()
+            z = zlib.compressobj(COMPRESS_LEVEL, zlib.DEFLATED, STREAM_WBITS[encoding])
+            wire = z.compress(body) + z.flush()
+            record_compression(encoding, raw=len(body), wire=len(wire), cpu=time.thread_time() - t0)
+            body = wire
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Vary", "Accept-Encoding")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle_timeline(self, path):
+        """/missions/{id}/timeline (JSON index) and /missions/{id}/timeline.jpg (sprite sheet)."""
+        parts = path.strip("/").split("/")
+        if len(parts) != 3 or parts[2] not in ("timeline", "timeline.jpg"):
+            self._send_json({"error": "not found"}, 404)
+            return
+        mission_id = parts[1]
+        if parts[2] == "timeline":
+            index = timeline_index(mission_id)
+            if index is None:
+                self._send_json({"error": "unknown mission"}, 404)
+            else:
+                self._send_json(index)
+            return
+
+        with timeline_lock:
+            tl = timelines.get(mission_id)
+            sprite = tl["sprite"] if tl else None
+            pending = tl is not None and any(kf["jpeg"] is not None for kf in tl["keyframes"])
+        if sprite is None:
+            if tl is None:
+                self._send_json({"error": "unknown mission"}, 404)
+            elif pending:
+                self._send_json({"error": "no sprite yet"}, 503)
+            else:
+                self._send_json({"error": "no keyframe images for this mission"}, 404)
+            return
+        self.send_response(200)
+        self._cors_headers()
+        self.send_header("Content-Type", "image/jpeg")
+        self.send_header("Content-Length", str(len(sprite)))
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(sprite)
+
+    def _handle_stereo_snapshot(self):
+        """Return the latest matched pair as one multipart/mixed payload."""
+        pair = stereo_sync.latest if stereo_sync else None
+        if pair is None:
+            self._send_json({"error": "no stereo pair available"}, 503)
+            return
+
+        self.send_response(200)
+        self._cors_headers()
+        self.send_header("Content-Type", f"multipart/mixed; boundary={STEREO_BOUNDARY}")
+        self.send_header("Content-Length", str(len(pair["body"])))
+        self.send_header("X-Stereo-Skew-Ms", str(pair["skew_ms"]))
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(pair["body"])
+
+    def _handle_stereo_stream(self):
+        """Stream matched pairs; each x-mixed-replace part is a multipart/mixed pair."""
+        if stereo_sync is None:
+            self._send_json({"error": "stereo disabled"}, 404)
+            return
+
+        self.send_response(200)
+        self._cors_headers()
+        self.send_header("Content-Type", "multipart/x-mixed-replace; boundary=frameboundary")
+        self.send_header("Cache-Control", "no-cache, no-store, must-revalidate")
+        self.end_headers()
+
+        evt = threading.Event()
+        with stereo_clients_lock:
+            stereo_clients.append(evt)
+
+        print(f"[cam]  Stereo client connected")
+
+        try:
+            last_seq = None
+            last_write = time.monotonic()
+            while True:
+                evt.wait(timeout=1.0)
+                evt.clear()
+
+                pair = stereo_sync.latest
+                repeat = pair is not None and pair["seq"] == last_seq
+                if pair is None or repeat:
+                    # Idle: keep writing now and then so a vanished client is noticed
+                    # and a relay downstream doesn't take the quiet for a dead link.
+                    if time.monotonic() - last_write < STREAM_KEEPALIVE:
+                        continue
+                    if pair is None:
+                        self.wfile.write(b"\r\n")  # preamble line, ignored by multipart parsers
+                        self.wfile.flush()
+                        last_write = time.monotonic()
+                        continue
+                last_seq = pair["seq"]
+                last_write = time.monotonic()
+
+                self.wfile.write(b"--frameboundary\r\n")
+                self.wfile.write(f"Content-Type: multipart/mixed; boundary={STEREO_BOUNDARY}\r\n".encode())
+                self.wfile.write(f"Content-Length: {len(pair['body'])}\r\n".encode())
+                self.wfile.write(f"X-Stereo-Skew-Ms: {pair['skew_ms']}\r\n".encode())
+                if repeat:
+                    self.wfile.write(b"X-Keepalive: 1\r\n")
+                self.wfile.write(b"\r\n")
+                self.wfile.write(pair["body"])
+                self.wfile.write(b"\r\n")
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError, OSError):
+            pass
+        finally:
+            with stereo_clients_lock:
+                if evt in stereo_clients:
+                    stereo_clients.remove(evt)
+            print(f"[cam]  Stereo client disconnected")
+
+    def _handle_profile(self, query):
+        if not DEBUG_TOKEN:
+            self._send_json({"error": "profiling disabled (set BRIDGE_DEBUG_TOKEN)"}, 404)
+            return
+        auth = self.headers.get("Authorization", "")
+        token = auth[7:] if auth.startswith("Bearer ") else ""  # never via ?token=, which ends up in logs
+        if not hmac.compare_digest(token.encode(), DEBUG_TOKEN.encode()):
+            self._send_json({"error": "unauthorized"}, 401)
+            return
+        try:
+            seconds = min(float(query.get("seconds", ["10"])[0]), PROFILE_MAX_SECONDS)
+            hz = min(float(query.get("hz", [str(PROFILE_DEFAULT_HZ)])[0]), PROFILE_MAX_HZ)
+        except ValueError:
+            self._send_json({"error": "seconds and hz must be numbers"}, 400)
+            return
+        if not (math.isfinite(seconds) and math.isfinite(hz)) or seconds <= 0 or hz <= 0:
+            self._send_json({"error": "seconds and hz must be positive and finite"}, 400)
+            return
+        if not profile_lock.acquire(blocking=False):
+            self._send_json({"error": "a profile is already running"}, 409)
+            return
+        try:
+            print(f"[prof] Sampling {len(sys._current_frames())} threads for {seconds:g}s at {hz:g} Hz")
+            samples, busy, collapsed = sample_stacks(seconds, hz)
+        finally:
+            profile_lock.release()
+        overhead = busy / seconds
+        print(f"[prof] {samples} samples, {busy * 1000:.0f} ms spent sampling ({overhead:.1%} of one core)")
+
+        body = collapsed.encode()
+        self.send_response(200)
+        self._cors_headers()
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("X-Profile-Samples", str(samples))
+        self.send_header("X-Profile-Overhead", f"{overhead:.4f}")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _event_encoding(self, query):
+        """MessagePack if asked for (query or Accept header) and installed, else SSE/JSON."""
+        wanted = query.get("encoding", [""])[0] == "msgpack" or any(
+            t in self.headers.get("Accept", "") for t in ("application/x-msgpack", "application/msgpack")
+        )
+        if wanted and msgpack is None:
+            print("[sse]  msgpack requested but not installed — falling back to JSON")
+            return "json"
+        return "msgpack" if wanted else "json"
+
+    def _handle_events_v2(self, encoding):
+        global compressed_event_clients
+        self.send_response(200)
+        self._cors_headers()
+        if encoding == "msgpack":
+            # Concatenated MessagePack maps; nil (0xc0) is the keepalive
+            self.send_header("Content-Type", "application/x-msgpack")
+            keepalive = b"\xc0"
+        else:
+            self.send_header("Content-Type", "text/event-stream")
+            keepalive = b": keepalive\n\n"
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "keep-alive")
+        enc = self._stream_encoder(shared=COMPRESSION_MODE == "shared")
+        self.end_headers()
+        compressed = enc.encoding != "identity"
+
+        q = queue.Queue(maxsize=256)
+        with event_lock:
+            if compressed:
+                compressed_event_clients += 1
+            snapshot = mission_snapshot()
+            if snapshot:
+                q.put(snapshot)
+            event_clients.append(q)
+
+        print(f"[sse]  v{EVENT_VERSION} {encoding} client connected ({len(event_clients)} total)")
+
+        try:
+            while True:
+                try:
+                    frames = q.get(timeout=STREAM_KEEPALIVE)
+                    if frames is None:
+                        print(f"[sse]  v{EVENT_VERSION} client fell behind, closing so it reconnects")
+                        break
+                    self.wfile.write(enc.encode(frames[encoding], frames.get(encoding + ".z")))
+                except queue.Empty:
+                    self.wfile.write(enc.encode(keepalive))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError, OSError):
+            pass
+        finally:
+            self.close_connection = True
+            with event_lock:
+                if compressed:
+                    compressed_event_clients -= 1
+                if q in event_clients:
+                    event_clients.remove(q)
+            print(f"[sse]  v{EVENT_VERSION} client disconnected ({len(event_clients)} total)")
+
     def _handle_mjpeg(self):
         """Stream MJPEG from /cam0/compressed ROS2 topic."""
         BOUNDARY = b"--frameboundary"
@@ -256,6 +1651,7 @@ class BridgeHandler(BaseHTTPRequestHandler):
 
         try:
             last_frame = None
+            last_write = time.monotonic()
             while True:
                 # Wait for a new frame or timeout (send last known frame as keepalive)
                 evt.wait(timeout=1.0)
@@ -264,17 +1660,25 @@ class BridgeHandler(BaseHTTPRequestHandler):
                 with latest_frame_lock:
                     frame = latest_frame
 
-                if frame is None:
-                    continue
-
-                # Skip if same frame (no new data)
-                if frame is last_frame:
-                    continue
+                repeat = frame is not None and frame is last_frame
+                if frame is None or repeat:
+                    # No new data: only write once STREAM_KEEPALIVE has passed, so a
+                    # vanished client is noticed and relays see the link is alive.
+                    if time.monotonic() - last_write < STREAM_KEEPALIVE:
+                        continue
+                    if frame is None:
+                        self.wfile.write(b"\r\n")  # preamble line, ignored by multipart parsers
+                        self.wfile.flush()
+                        last_write = time.monotonic()
+                        continue
                 last_frame = frame
+                last_write = time.monotonic()
 
                 self.wfile.write(BOUNDARY + b"\r\n")
                 self.wfile.write(b"Content-Type: image/jpeg\r\n")
                 self.wfile.write(f"Content-Length: {len(frame)}\r\n".encode())
+                if repeat:
+                    self.wfile.write(b"X-Keepalive: 1\r\n")
                 self.wfile.write(b"\r\n")
                 self.wfile.write(frame)
                 self.wfile.write(b"\r\n")
@@ -308,40 +1712,181 @@ class BridgeHandler(BaseHTTPRequestHandler):
         self.end_headers()
         self.wfile.write(frame)
 
+    def _handle_array(self, path, query):
+        """ROI crop / downsampled array / channel stats over the decoded latest frame."""
+        if np is None or (cv2 is None and Image is None):
+            self._send_json({"error": "numpy and cv2 or Pillow are required"}, 501)
+            return
+        with latest_frame_lock:
+            frame = latest_frame
+        if frame is None:
+            self._send_json({"error": "no frame available"}, 503)
+            return
+
+        arr = cam0_decoded.get(frame)
+        if arr is None:
+            self._send_json({"error": "frame undecodable"}, 503)
+            return
+        try:
+            h, w = arr.shape[:2]
+            x = min(max(int(query.get("x", ["0"])[0]), 0), w)
+            y = min(max(int(query.get("y", ["0"])[0]), 0), h)
+            rw = min(max(int(query.get("w", [str(w)])[0]), 0), w - x)
+            rh = min(max(int(query.get("h", [str(h)])[0]), 0), h - y)
+            step = max(int(query.get("step", ["1"])[0]), 1)
+        except ValueError as e:
+            self._send_json({"error": f"bad request: {e}"}, 400)
+            return
+        roi = arr[y:y + rh:step, x:x + rw:step]  # a view, no copy
+        if roi.size == 0:
+            self._send_json({"error": "empty region"}, 400)
+            return
+
+        if path == "/cam0/channels":
+            pixels = roi.reshape(-1, 1 if roi.ndim == 2 else roi.shape[2])
+            names = ["gray"] if pixels.shape[1] == 1 else ["r", "g", "b"]
+            mean, std = pixels.mean(axis=0), pixels.std(axis=0)
+            lo, hi = pixels.min(axis=0), pixels.max(axis=0)
+            self._send_json({
+                "frame_shape": list(arr.shape),
+                "roi": {"x": x, "y": y, "w": rw, "h": rh, "step": step},
+                "channels": {n: {"mean": round(float(mean[i]), 3), "std": round(float(std[i]), 3),
+                                 "min": int(lo[i]), "max": int(hi[i])} for i, n in enumerate(names)},
+            })
+            return
+
+        fmt = "npy" if path == "/cam0/frame.npy" else query.get("format", ["jpeg"])[0]
+        if fmt == "npy":
+            buf = io.BytesIO()
+            np.save(buf, roi)
+            body, ctype = buf.getvalue(), "application/octet-stream"
+        else:
+            body, ctype = encode_jpeg(roi), "image/jpeg"
+
+        self.send_response(200)
+        self._cors_headers()
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("X-Frame-Shape", "x".join(map(str, arr.shape)))
+        self.send_header("X-Roi", f"{x},{y},{rw},{rh},{step}")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def parse_request(self):
+        ok = super().parse_request()
+        if ok:
+            thread_tags[threading.get_ident()] = f"{self.command} {urlsplit(self.path).path}"
+        return ok
+
     def log_message(self, format, *args):
         if args and "404" in str(args[0]):
             super().log_message(format, *args)
 
 
+class ControlHandler(BridgeHandler):
+    """Control lane listener: goals, preflights and a liveness check only."""
+
+    def _get(self):
+        if urlsplit(self.path).path == "/":
+            self._send_json({"status": "ok", "lane": "control"})
+        else:
+            self.send_response(404)
+            self._cors_headers()
+            self.end_headers()
+
+
 class ThreadedHTTPServer(HTTPServer):
     """Handle each request in a new thread (needed for long-lived SSE/MJPEG connections)."""
     allow_reuse_address = True
     daemon_threads = True
+    request_queue_size = LISTEN_BACKLOG
+    lanes = lanes
 
     def process_request(self, request, client_address):
-        t = threading.Thread(target=self.process_request_thread, args=(request, client_address), daemon=True)
+        t = threading.Thread(target=self.process_request_thread,
+                             args=(request, client_address, time.monotonic()), daemon=True)
         t.start()
 
-    def process_request_thread(self, request, client_address):
+    def process_request_thread(self, request, client_address, accepted_at=None):
+        conn_state.accepted_at = accepted_at
         try:
             self.finish_request(request, client_address)
         except Exception:
             self.handle_error(request, client_address)
         finally:
+            thread_tags.pop(threading.get_ident(), None)
             self.shutdown_request(request)
 
 
+class ControlHTTPServer(ThreadedHTTPServer):
+    """Separate socket (and accept queue) for the control lane."""
+    request_queue_size = CONTROL_BACKLOG
+    lanes = control_lanes
+
+
 def main():
-    # Start camera subscriber in background
-    cam_thread = threading.Thread(target=start_cam_subscriber, daemon=True)
-    cam_thread.start()
+    global STEREO_TOPICS, stereo_sync, relay_upstream, COMPRESSION_MODE
+    parser = argparse.ArgumentParser(description="Edge Rescue HTTP + SSE bridge")
+    parser.add_argument("--qos", action="append", default=[], metavar="TOPIC=POLICY[,depth=N][,deadline_ms=N]",
+                        help="override camera QoS, e.g. /cam0/compressed=reliable,depth=5")
+    parser.add_argument("--stereo", default=",".join(STEREO_TOPICS), metavar="LEFT,RIGHT",
+                        help="camera topics forming the stereo pair ('' to disable)")
+    parser.add_argument("--stereo-tolerance-ms", type=float, default=STEREO_TOLERANCE_MS,
+                        help="max header-stamp skew between paired frames")
+    parser.add_argument("--relay", metavar="URL",
+                        help="relay another bridge (e.g. http://robot:9090) instead of subscribing to ROS2")
+    parser.add_argument("--port", type=int, default=PORT, help="HTTP port to listen on")
+    parser.add_argument("--control-port", type=int, default=CONTROL_PORT,
+                        help="dedicated listener for /goal and preflights (0 to disable)")
+    parser.add_argument("--compression", choices=("stream", "shared", "off"), default=COMPRESSION_MODE,
+                        help="gzip/deflate for event streams: per-connection compressor, "
+                             "one shared deflate per event, or disabled")
+    args = parser.parse_args()
+    for spec in args.qos:
+        try:
+            topic, qos = parse_qos_override(spec)
+        except ValueError as e:
+            parser.error(str(e))
+        CAMERA_QOS[topic] = qos
+    COMPRESSION_MODE = args.compression
+
+    if args.stereo:
+        topics = tuple(t.strip() for t in args.stereo.split(","))
+        if len(topics) != 2:
+            parser.error("--stereo takes exactly two topics: LEFT,RIGHT")
+        STEREO_TOPICS = topics
+        stereo_sync = StereoSync(args.stereo_tolerance_ms)
+
+    if args.relay:
+        relay_upstream = args.relay.rstrip("/")
+        start_relay()
+    else:
+        # Start camera subscriber in background
+        cam_thread = threading.Thread(target=tagged("cam", start_cam_subscriber), daemon=True)
+        cam_thread.start()
 
-    server = ThreadedHTTPServer((HOST, PORT), BridgeHandler)
-    print(f"Edge Rescue bridge listening on http://{HOST}:{PORT}")
+    server = ThreadedHTTPServer((HOST, args.port), BridgeHandler)
+    if args.control_port:
+        control = ControlHTTPServer((HOST, args.control_port), ControlHandler)
+        threading.Thread(target=tagged("control accept", control.serve_forever), daemon=True).start()
+    print(f"Edge Rescue bridge listening on http://{HOST}:{args.port}")
+    if args.control_port:
+        print(f"  control lane on http://{HOST}:{args.control_port} (POST /goal, OPTIONS)")
+    if relay_upstream:
+        print(f"  relaying {relay_upstream} (goals are forwarded upstream)")
     print(f"  POST /goal        — send a mission prompt")
     print(f"  GET  /events      — SSE stream of plan/subtask updates")
+    print(f"  GET  /events?v=2  — sequence-numbered mission events (msgpack: {'yes' if msgpack else 'not installed'})")
     print(f"  GET  /cam0/stream — MJPEG video from /cam0/compressed")
     print(f"  GET  /cam0/snap   — single JPEG snapshot")
+    print(f"  GET  /cam0/roi    — ROI crop / frame.npy / channels of the decoded frame")
+    print(f"  GET  /missions/{{id}}/timeline[.jpg] — per-subtask keyframes + sprite sheet")
+    if stereo_sync:
+        print(f"  GET  /stereo/snap — matched {STEREO_TOPICS[0]} + {STEREO_TOPICS[1]} pair (±{args.stereo_tolerance_ms:g} ms)")
+        print(f"  GET  /stereo/stream — stream of matched pairs")
+    print(f"  GET  /stats       — camera drop/latency statistics")
+    print(f"  GET  /debug/profile?seconds=N — stack sampling profiler ({'enabled' if DEBUG_TOKEN else 'disabled'})")
     print(f"Waiting for connections...\n")
     try:
         server.serve_forever()